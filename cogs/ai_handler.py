@@ -8,7 +8,7 @@ from discord.ext import commands
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-from database.models import Guild, Ticket, AIConfig
+from database.models import Guild, Ticket, TicketCategory, AIConfig
 from database.manager import db_manager
 from utils.embeds import create_success_embed, create_error_embed, create_info_embed
 from utils.ai import analyze_sentiment, generate_ticket_tags, analyze_common_issues
@@ -286,16 +286,20 @@ class AIHandlerCog(commands.Cog):
 
                 # Sentiment analysis
                 if config.sentiment_analysis_enabled:
-                    sentiment = await analyze_sentiment(ticket.content)
+                    sentiment_label, sentiment_confidence = analyze_sentiment(ticket.content)
                     embed.add_field(
                         name="Sentiment Analysis",
-                        value=f"Score: {sentiment:.2%} positive",
+                        value=f"{sentiment_label.title()} ({sentiment_confidence:.0%} confidence)",
                         inline=False
                     )
 
                 # Tag generation
                 if config.tag_generation_enabled:
-                    tags = await generate_ticket_tags(ticket.content)
+                    category = (
+                        await session.get(TicketCategory, ticket.category_db_id)
+                        if ticket.category_db_id else None
+                    )
+                    tags = generate_ticket_tags(ticket.content, category.name if category else "general")
                     embed.add_field(
                         name="Generated Tags",
                         value=", ".join(tags) if tags else "No tags generated",
@@ -303,7 +307,7 @@ class AIHandlerCog(commands.Cog):
                     )
 
                 # Common issues analysis
-                issues = await analyze_common_issues(ticket.content)
+                issues = analyze_common_issues(ticket.content)
                 if issues:
                     embed.add_field(
                         name="Identified Issues",
@@ -14,6 +14,9 @@ from .models import Base
 class DatabaseManager:
     """Manages database connections and operations."""
     
+    POOL_SIZE = 20
+    POOL_WARMUP_SIZE = 5
+    
     def __init__(self):
         """Initialize the database manager."""
         self.logger = logging.getLogger("database")
@@ -36,7 +39,7 @@ class DatabaseManager:
             self._engine = create_async_engine(
                 self.db_url,
                 poolclass=AsyncAdaptedQueuePool,
-                pool_size=20,
+                pool_size=self.POOL_SIZE,
                 max_overflow=10,
                 pool_timeout=30,
                 pool_recycle=1800,
@@ -54,6 +57,9 @@ class DatabaseManager:
             async with self._engine.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
             
+            # Open the first connections in parallel rather than on first use
+            await self._warm_pool(self.POOL_WARMUP_SIZE)
+            
             self._initialized = True
             self.logger.info("Successfully initialized database connection")
             
@@ -61,6 +67,18 @@ class DatabaseManager:
             self.logger.error(f"Failed to initialize database: {e}")
             raise
     
+    async def _warm_pool(self, size: int):
+        """Check out `size` connections concurrently and return them to the pool."""
+        results = await asyncio.gather(
+            *(self._engine.connect() for _ in range(size)),
+            return_exceptions=True
+        )
+        connections = [conn for conn in results if not isinstance(conn, BaseException)]
+        await asyncio.gather(*(conn.close() for conn in connections))
+        
+        if len(connections) < size:
+            self.logger.warning(f"Pool warm-up opened {len(connections)}/{size} connections")
+    
     @property
     def session(self) -> AsyncSession:
         """Get a new database session."""
@@ -68,6 +86,13 @@ class DatabaseManager:
             raise RuntimeError("Database not initialized. Call initialize_database() first.")
         return self._session_factory()
 
+    @property
+    def engine(self):
+        """Get the database engine."""
+        if not self._initialized:
+            raise RuntimeError("Database not initialized. Call initialize_database() first.")
+        return self._engine
+
     @property
     def Session(self):
         """Get the session factory for compatibility with existing code."""
@@ -190,13 +215,18 @@ class DatabaseManager:
         """Add a participant to a ticket."""
         try:
             async with self.session as session:
-                await session.execute(
+                result = await session.execute(
                     text("""
-                        INSERT INTO ticket_participants (ticket_db_id, user_id, role)
-                        VALUES (:ticket_db_id, :user_id, :role)
+                        INSERT INTO ticket_participants (ticket_db_id, guild_id, user_id, role)
+                        SELECT ticket_db_id, guild_id, :user_id, :role
+                        FROM tickets WHERE ticket_db_id = :ticket_db_id
                     """),
                     {"ticket_db_id": ticket_db_id, "user_id": user_id, "role": role}
                 )
+                # INSERT ... SELECT writes nothing if the ticket doesn't exist
+                if result.rowcount == 0:
+                    self.logger.error(f"Failed to add ticket participant: ticket {ticket_db_id} not found")
+                    return False
                 await session.commit()
                 return True
         except Exception as e:
@@ -216,13 +246,17 @@ class DatabaseManager:
         """Add an internal note to a ticket."""
         try:
             async with self.session as session:
-                await session.execute(
+                result = await session.execute(
                     text("""
-                        INSERT INTO ticket_notes (ticket_db_id, staff_id, note, created_at)
-                        VALUES (:ticket_db_id, :staff_id, :note, CURRENT_TIMESTAMP)
+                        INSERT INTO ticket_notes (ticket_db_id, guild_id, staff_id, note, created_at)
+                        SELECT ticket_db_id, guild_id, :staff_id, :note, CURRENT_TIMESTAMP
+                        FROM tickets WHERE ticket_db_id = :ticket_db_id
                     """),
                     {"ticket_db_id": ticket_db_id, "staff_id": staff_id, "note": note}
                 )
+                if result.rowcount == 0:
+                    self.logger.error(f"Failed to add internal note: ticket {ticket_db_id} not found")
+                    return False
                 await session.commit()
                 return True
         except Exception as e:
@@ -233,13 +267,17 @@ class DatabaseManager:
         """Add feedback for a ticket."""
         try:
             async with self.session as session:
-                await session.execute(
+                result = await session.execute(
                     text("""
-                        INSERT INTO ticket_feedback (ticket_db_id, user_id, rating, comments, submitted_at)
-                        VALUES (:ticket_db_id, :user_id, :rating, :comments, CURRENT_TIMESTAMP)
+                        INSERT INTO ticket_feedback (ticket_db_id, guild_id, user_id, rating, comments, submitted_at)
+                        SELECT ticket_db_id, guild_id, :user_id, :rating, :comments, CURRENT_TIMESTAMP
+                        FROM tickets WHERE ticket_db_id = :ticket_db_id
                     """),
                     {"ticket_db_id": ticket_db_id, "user_id": user_id, "rating": rating, "comments": comments}
                 )
+                if result.rowcount == 0:
+                    self.logger.error(f"Failed to add ticket feedback: ticket {ticket_db_id} not found")
+                    return False
                 await session.commit()
                 return True
         except Exception as e:
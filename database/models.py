@@ -8,7 +8,8 @@ import uuid
 import json
 from sqlalchemy import (
     Column, Integer, String, Boolean, DateTime, 
-    ForeignKey, JSON, Float, Text, Table
+    ForeignKey, JSON, Float, Text, Table, CheckConstraint, UniqueConstraint,
+    Enum as SQLEnum
 )
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.engine import Engine
@@ -31,6 +32,12 @@ class TicketStatus(str, enum.Enum):
     ON_HOLD = "ON_HOLD"
     PENDING_STAFF = "PENDING_STAFF"
 
+class TaskStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
 # Association table for category-SLA rules
 category_sla_rules = Table(
     'category_sla_rules',
@@ -42,11 +49,17 @@ category_sla_rules = Table(
 class TicketCategory(Base):
     """Ticket category configuration."""
     __tablename__ = "ticket_categories"
+    __table_args__ = (
+        UniqueConstraint("guild_id", "name", name="uq_ticket_categories_guild_name"),
+    )
 
     id = Column(Integer, primary_key=True)
     guild_id = Column(String, ForeignKey("guilds.guild_id"))
     name = Column(String(100))
     description = Column(Text, nullable=True)
+    emoji = Column(String, nullable=True)
+    modal_fields = Column(JSON, nullable=True)
+    initial_message_template = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -94,9 +107,11 @@ class Guild(Base):
     # Relationships
     tickets = relationship("Ticket", back_populates="guild")
     categories = relationship("TicketCategory", back_populates="guild")
-    staff = relationship("StaffMember", back_populates="guild")
+    staff_stats = relationship("StaffPerformance", back_populates="guild")
     sla_definitions = relationship("SLADefinition", back_populates="guild")
-    settings = relationship("GuildSettings", back_populates="guild", uselist=False)
+    ai_config = relationship("AIConfig", back_populates="guild", uselist=False)
+    maintenance_schedules = relationship("MaintenanceSchedule", back_populates="guild")
+    tasks = relationship("Task", back_populates="guild")
 
 class Ticket(Base):
     """Ticket information and metadata."""
@@ -104,12 +119,12 @@ class Ticket(Base):
 
     ticket_db_id = Column(Integer, primary_key=True)
     ticket_id_display = Column(String(20))
-    guild_id = Column(String, ForeignKey("guilds.guild_id"))
-    channel_id = Column(String)
-    creator_id = Column(String)
+    guild_id = Column(String, ForeignKey("guilds.guild_id"), nullable=False)
+    channel_id = Column(String, nullable=False)
+    creator_id = Column(String, nullable=False)
     claimed_by_id = Column(String, nullable=True)
-    status = Column(String, default=TicketStatus.OPEN)
-    category_db_id = Column(Integer, ForeignKey("ticket_categories.category_db_id"))
+    status = Column(String, default=TicketStatus.OPEN, nullable=False)
+    category_db_id = Column(Integer, ForeignKey("ticket_categories.id"))
     opened_at = Column(DateTime, default=datetime.utcnow)
     last_message_at = Column(DateTime, nullable=True)
     closed_at = Column(DateTime, nullable=True)
@@ -118,13 +133,8 @@ class Ticket(Base):
     transcript_url = Column(String, nullable=True)
     last_staff_response_at = Column(DateTime, nullable=True)
     last_user_response_at = Column(DateTime, nullable=True)
-    initial_input_data = Column(JSON, nullable=True)
-    internal_notes = Column(JSON, nullable=True)
     linked_tickets = Column(JSON, nullable=True)
     anonymous_mode = Column(Boolean, default=False)
-    sentiment_score_history = Column(JSON, nullable=True)
-    ai_tags = Column(JSON, nullable=True)
-    ai_summary = Column(String, nullable=True)
     scheduled_followup_at = Column(DateTime, nullable=True)
     closed_by_id = Column(String, nullable=True)
 
@@ -133,6 +143,36 @@ class Ticket(Base):
     category = relationship("TicketCategory", back_populates="tickets")
     participants = relationship("TicketParticipant", back_populates="ticket")
     feedback = relationship("TicketFeedback", back_populates="ticket")
+    ai_data = relationship("TicketAI", back_populates="ticket", uselist=False)
+    notes = relationship("TicketNote", back_populates="ticket")
+
+class TicketAI(Base):
+    """Rarely-read form input and AI analysis data, kept off the tickets row."""
+    __tablename__ = "ticket_ai"
+
+    ticket_db_id = Column(Integer, ForeignKey("tickets.ticket_db_id"), primary_key=True)
+    guild_id = Column(String, ForeignKey("guilds.guild_id"), nullable=False)
+    initial_input_data = Column(JSON, nullable=True)
+    sentiment_score_history = Column(JSON, nullable=True)
+    ai_tags = Column(JSON, nullable=True)
+    ai_summary = Column(String, nullable=True)
+
+    # Relationships
+    ticket = relationship("Ticket", back_populates="ai_data")
+
+class TicketNote(Base):
+    """Internal staff note on a ticket."""
+    __tablename__ = "ticket_notes"
+
+    note_id = Column(Integer, primary_key=True)
+    ticket_db_id = Column(Integer, ForeignKey("tickets.ticket_db_id"), nullable=False)
+    guild_id = Column(String, ForeignKey("guilds.guild_id"), nullable=False)
+    staff_id = Column(String, nullable=True)
+    note = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    ticket = relationship("Ticket", back_populates="notes")
 
 class TicketParticipant(Base):
     """Participants in a ticket."""
@@ -140,6 +180,7 @@ class TicketParticipant(Base):
 
     participant_id = Column(Integer, primary_key=True)
     ticket_db_id = Column(Integer, ForeignKey("tickets.ticket_db_id"))
+    guild_id = Column(String, ForeignKey("guilds.guild_id"))  # Partition key, mirrors the ticket's guild
     user_id = Column(String)
     role = Column(String)  # 'creator', 'added_staff', 'added_user'
     added_at = Column(DateTime, default=datetime.utcnow)
@@ -150,9 +191,13 @@ class TicketParticipant(Base):
 class TicketFeedback(Base):
     """User feedback for resolved tickets."""
     __tablename__ = "ticket_feedback"
+    __table_args__ = (
+        CheckConstraint("rating BETWEEN 1 AND 5", name="ck_ticket_feedback_rating_range"),
+    )
 
     feedback_id = Column(Integer, primary_key=True)
     ticket_db_id = Column(Integer, ForeignKey("tickets.ticket_db_id"))
+    guild_id = Column(String, ForeignKey("guilds.guild_id"))
     user_id = Column(String)
     rating = Column(Integer)
     comments = Column(String, nullable=True)
@@ -161,6 +206,25 @@ class TicketFeedback(Base):
     # Relationships
     ticket = relationship("Ticket", back_populates="feedback")
 
+class KnowledgeBase(Base):
+    """Knowledge base article."""
+    __tablename__ = "knowledge_base"
+    __table_args__ = (
+        UniqueConstraint("guild_id", "title", name="uq_knowledge_base_guild_title"),
+    )
+
+    article_id = Column(Integer, primary_key=True)
+    guild_id = Column(String, ForeignKey("guilds.guild_id"))
+    title = Column(String, nullable=False)
+    content = Column(Text, nullable=False)
+    keywords = Column(JSON, nullable=True)
+    url = Column(String, nullable=True)
+    category = Column(String, nullable=True)
+    created_by = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_edited_by = Column(String, nullable=True)
+    last_edited_at = Column(DateTime, nullable=True)
+
 class StaffPerformance(Base):
     """Staff performance metrics."""
     __tablename__ = "staff_performance"
@@ -4,20 +4,27 @@ This module initializes and runs the bot with all necessary configurations.
 """
 import os
 import sys
-import platform
+import signal
 import asyncio
 import discord
+from contextlib import asynccontextmanager
 from discord.ext import commands
 from pathlib import Path
-from dotenv import load_dotenv
 from database.connection import db_manager
 from utils.logger import logger
 from utils.banner import print_banner
+from utils.constants import init_dirs
 from utils.tasks import initialize
 from utils.shutdown import ShutdownManager
 
 VERSION = "1.0.0"
 
+# Maximum number of extensions set up at once
+EXTENSION_LOAD_CONCURRENCY = 8
+
+# Pool connections left free for runtime traffic while extensions load
+EXTENSION_LOAD_POOL_HEADROOM = 2
+
 class NexonBot(commands.Bot):
     """
     Main bot class for Nexon Support System.
@@ -60,28 +67,45 @@ class NexonBot(commands.Bot):
             'database': '💾',
             'maintenance': '🔧'
         }
-        
-        # Show startup banner
-        print_banner(VERSION)
 
     @property
     def emojis(self):
         """Get bot emojis dictionary"""
         return self._bot_emojis
 
-    async def setup_hook(self):
-        """Initialize bot configuration and load extensions"""
+    @asynccontextmanager
+    async def lifespan(self):
+        """
+        Own the bot's resources for the lifetime of the process.
+        Resources are entered in order (database, task manager) and
+        released in reverse order exactly once on exit.
+        """
+        # Initialize database first
+        logger.info(f"{self.emojis['loading']} Initializing database...")
+        await self.db.initialize_database()
+        logger.info(f"{self.emojis['success']} Database initialized")
+
         try:
-            # Initialize database first
-            logger.info(f"{self.emojis['loading']} Initializing database...")
-            await self.db.initialize_database()
-            logger.info(f"{self.emojis['success']} Database initialized")
-            
             # Initialize task manager
             logger.info(f"{self.emojis['loading']} Starting task manager...")
             self.task_manager = await initialize(self)
             logger.info(f"{self.emojis['success']} Task manager initialized")
-            
+
+            yield self
+        finally:
+            try:
+                # Stop task manager
+                if hasattr(self, 'task_manager'):
+                    await self.task_manager.stop()
+            except Exception as e:
+                logger.error(f"{self.emojis['error']} Error stopping task manager: {e}")
+            finally:
+                # Close database connection
+                await self.db.close()
+
+    async def setup_hook(self):
+        """Load extensions once the gateway session is being set up"""
+        try:
             # Load extensions
             logger.info(f"{self.emojis['loading']} Loading extensions...")
             await self._load_extensions()
@@ -91,64 +115,87 @@ class NexonBot(commands.Bot):
             raise
 
     async def _load_extensions(self):
-        """Load all extensions from the cogs directory"""
+        """Load all extensions from the cogs directory concurrently"""
         cogs_dir = Path("cogs")
-        for cog_file in cogs_dir.glob("*.py"):
-            if not cog_file.name.startswith("_"):
-                try:
-                    await self.load_extension(f"cogs.{cog_file.stem}")
-                    logger.info(f"{self.emojis['success']} Loaded extension: {cog_file.name}")
-                except Exception as e:
-                    logger.error(f"{self.emojis['error']} Failed to load extension {cog_file.name}: {e}")
+        cog_files = [f for f in cogs_dir.glob("*.py") if not f.name.startswith("_")]
+
+        semaphore = asyncio.Semaphore(self._extension_load_limit())
+        await asyncio.gather(*(self._load_extension_file(f, semaphore) for f in cog_files))
+
+    def _extension_load_limit(self) -> int:
+        """Cap concurrent cog setup so it can't exhaust the database pool"""
+        pool = self.db.engine.pool
+        # Pools without a fixed size (e.g. NullPool) open a connection per session
+        if not hasattr(pool, "size"):
+            return EXTENSION_LOAD_CONCURRENCY
+        return max(1, min(EXTENSION_LOAD_CONCURRENCY, pool.size() - EXTENSION_LOAD_POOL_HEADROOM))
+
+    async def _load_extension_file(self, cog_file: Path, semaphore: asyncio.Semaphore):
+        """Load a single extension"""
+        async with semaphore:
+            try:
+                await self.load_extension(f"cogs.{cog_file.stem}")
+                logger.info(f"{self.emojis['success']} Loaded extension: {cog_file.name}")
+            except Exception as e:
+                logger.error(f"{self.emojis['error']} Failed to load extension {cog_file.name}: {e}")
 
     async def close(self):
-        """Cleanup and close the bot"""
+        """Close the gateway connection; resources are released by lifespan()"""
+        if self.is_closed():
+            return
+
         logger.info(f"{self.emojis['shutdown']} Bot is shutting down...")
-        
+        await super().close()
+
+def _install_signal_handlers(bot: NexonBot) -> None:
+    """Schedule bot.close() on the event loop when a termination signal arrives"""
+    loop = asyncio.get_running_loop()
+
+    def request_close(*_):
+        loop.call_soon_threadsafe(lambda: loop.create_task(bot.close()))
+
+    signals = [signal.SIGINT, signal.SIGTERM]
+    if hasattr(signal, 'SIGBREAK'):
+        # Ctrl+Break on Windows consoles
+        signals.append(signal.SIGBREAK)
+
+    for sig in signals:
         try:
-            # Stop task manager
-            if hasattr(self, 'task_manager'):
-                await self.task_manager.stop()
-                
-            # Close database connection
-            await self.db.close()
-            
-        except Exception as e:
-            logger.error(f"{self.emojis['error']} Error during shutdown: {e}")
-        finally:
-            await super().close()
+            loop.add_signal_handler(sig, request_close)
+        except NotImplementedError:
+            # Windows event loops don't support add_signal_handler
+            signal.signal(sig, request_close)
 
 async def main():
     """Main entry point for the bot"""
     try:
-        # Load environment variables
-        load_dotenv()
+        # Only read .env when the environment doesn't already provide the token
+        if not os.getenv("DISCORD_TOKEN"):
+            from dotenv import load_dotenv
+            load_dotenv()
         token = os.getenv("DISCORD_TOKEN")
         
         if not token:
             raise ValueError("No Discord token found in environment variables")
         
+        init_dirs()
+        
         # Create bot instance
         bot = NexonBot()
         
-        # Set up Windows-specific handlers
-        if platform.system() == 'Windows':
-            import win32api
-            def handler(type):
-                bot.should_exit = True
-                return True
-            win32api.SetConsoleCtrlHandler(handler, True)
+        # Route termination signals into a graceful close
+        _install_signal_handlers(bot)
+        
+        # Show startup banner without blocking the event loop on terminal I/O
+        await asyncio.to_thread(print_banner, VERSION)
         
-        # Start the bot
-        async with bot:
+        # Start the bot; resources are released in reverse order on exit
+        async with bot.lifespan(), bot:
             await bot.start(token)
             
     except Exception as e:
         logger.error(f"{bot.emojis['error'] if 'bot' in locals() else '❌'} Failed to start bot: {e}")
         raise
-    finally:
-        if 'bot' in locals():
-            await bot.close()
 
 if __name__ == "__main__":
     try:
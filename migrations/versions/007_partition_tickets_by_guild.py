@@ -0,0 +1,114 @@
+"""Hash-partition tickets and ticket_participants by guild_id."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+# Number of hash partitions per table. Both tables use the same modulus so
+# that joins on (ticket_db_id, guild_id) stay partition-wise.
+NUM_PARTITIONS = 8
+
+TICKET_INDEXES = {
+    'idx_tickets_guild_id': ['guild_id'],
+    'idx_tickets_status': ['status'],
+    'idx_tickets_category': ['category_db_id'],
+    'idx_tickets_creator': ['creator_id'],
+    'idx_tickets_claimed_by': ['claimed_by_id'],
+}
+
+PARTICIPANT_INDEXES = {
+    'idx_participants_ticket': ['ticket_db_id'],
+    'idx_participants_user': ['user_id'],
+}
+
+def _rebuild_table(table, primary_key, partitioned):
+    """Recreate a table with the same columns, optionally hash-partitioned, and move its rows"""
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+
+    partition_clause = " PARTITION BY HASH (guild_id)" if partitioned else ""
+    op.execute(f"CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS){partition_clause}")
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({', '.join(primary_key)})")
+
+    if partitioned:
+        for remainder in range(NUM_PARTITIONS):
+            op.execute(
+                f"CREATE TABLE {table}_p{remainder} PARTITION OF {table} "
+                f"FOR VALUES WITH (MODULUS {NUM_PARTITIONS}, REMAINDER {remainder})"
+            )
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+    # CASCADE also drops the old indexes and any foreign keys pointing at it
+    op.execute(f"DROP TABLE {table}_old CASCADE")
+
+def _create_indexes(table, indexes):
+    for name, columns in indexes.items():
+        op.create_index(name, table, columns)
+
+def upgrade():
+    # Declarative partitioning is PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Child tables carry the partition key so they can reference (ticket_db_id, guild_id)
+    for table in ('ticket_participants', 'ticket_feedback'):
+        op.add_column(table, sa.Column('guild_id', sa.String(), sa.ForeignKey('guilds.guild_id')))
+        op.execute(
+            f"UPDATE {table} AS child SET guild_id = t.guild_id "
+            f"FROM tickets AS t WHERE t.ticket_db_id = child.ticket_db_id"
+        )
+
+    # The partition key must be part of the primary key
+    op.alter_column('tickets', 'guild_id', nullable=False)
+    op.alter_column('ticket_participants', 'guild_id', nullable=False)
+
+    _rebuild_table('tickets', ['ticket_db_id', 'guild_id'], partitioned=True)
+    op.create_foreign_key('tickets_guild_id_fkey', 'tickets', 'guilds', ['guild_id'], ['guild_id'])
+    op.create_foreign_key(
+        'tickets_category_db_id_fkey', 'tickets', 'ticket_categories',
+        ['category_db_id'], ['category_db_id']
+    )
+    _create_indexes('tickets', TICKET_INDEXES)
+
+    _rebuild_table('ticket_participants', ['participant_id', 'guild_id'], partitioned=True)
+    op.create_foreign_key(
+        'ticket_participants_guild_id_fkey', 'ticket_participants', 'guilds',
+        ['guild_id'], ['guild_id']
+    )
+    _create_indexes('ticket_participants', PARTICIPANT_INDEXES)
+
+    for table in ('ticket_participants', 'ticket_feedback'):
+        op.create_foreign_key(
+            f'{table}_ticket_fkey', table, 'tickets',
+            ['ticket_db_id', 'guild_id'], ['ticket_db_id', 'guild_id']
+        )
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in ('ticket_participants', 'ticket_feedback'):
+        op.drop_constraint(f'{table}_ticket_fkey', table, type_='foreignkey')
+
+    _rebuild_table('ticket_participants', ['participant_id'], partitioned=False)
+    _create_indexes('ticket_participants', PARTICIPANT_INDEXES)
+
+    _rebuild_table('tickets', ['ticket_db_id'], partitioned=False)
+    op.alter_column('tickets', 'guild_id', nullable=True)
+    op.create_foreign_key('tickets_guild_id_fkey', 'tickets', 'guilds', ['guild_id'], ['guild_id'])
+    op.create_foreign_key(
+        'tickets_category_db_id_fkey', 'tickets', 'ticket_categories',
+        ['category_db_id'], ['category_db_id']
+    )
+    _create_indexes('tickets', TICKET_INDEXES)
+
+    for table in ('ticket_participants', 'ticket_feedback'):
+        op.drop_column(table, 'guild_id')
+        op.create_foreign_key(
+            f'{table}_ticket_db_id_fkey', table, 'tickets',
+            ['ticket_db_id'], ['ticket_db_id']
+        )
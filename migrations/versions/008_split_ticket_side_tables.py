@@ -0,0 +1,103 @@
+"""Move rarely-read JSON columns off tickets into ticket_ai and ticket_notes."""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from datetime import datetime
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+AI_COLUMNS = ('initial_input_data', 'sentiment_score_history', 'ai_tags', 'ai_summary')
+
+def upgrade():
+    # JSONB, ARRAY and the array/JSON backfill below are PostgreSQL-only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # 1:1 side table for form input and AI analysis
+    op.create_table(
+        'ticket_ai',
+        sa.Column('ticket_db_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('guild_id', sa.String(), sa.ForeignKey('guilds.guild_id'), nullable=False),
+        sa.Column('initial_input_data', postgresql.JSONB()),
+        sa.Column('sentiment_score_history', postgresql.JSONB()),
+        sa.Column('ai_tags', postgresql.ARRAY(sa.String())),
+        sa.Column('ai_summary', sa.Text()),
+        sa.ForeignKeyConstraint(
+            ['ticket_db_id', 'guild_id'], ['tickets.ticket_db_id', 'tickets.guild_id'],
+            name='ticket_ai_ticket_fkey'
+        )
+    )
+
+    # One row per internal note
+    op.create_table(
+        'ticket_notes',
+        sa.Column('note_id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('ticket_db_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('guild_id', sa.String(), sa.ForeignKey('guilds.guild_id'), nullable=False),
+        sa.Column('staff_id', sa.String()),
+        sa.Column('note', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), default=datetime.utcnow),
+        sa.ForeignKeyConstraint(
+            ['ticket_db_id', 'guild_id'], ['tickets.ticket_db_id', 'tickets.guild_id'],
+            name='ticket_notes_ticket_fkey'
+        )
+    )
+    op.create_index('idx_ticket_notes_ticket', 'ticket_notes', ['ticket_db_id'])
+
+    # Copy existing data
+    op.execute(f"""
+        INSERT INTO ticket_ai (ticket_db_id, guild_id, {', '.join(AI_COLUMNS)})
+        SELECT ticket_db_id, guild_id, {', '.join(AI_COLUMNS)}
+        FROM tickets
+        WHERE {' OR '.join(f'{column} IS NOT NULL' for column in AI_COLUMNS)}
+    """)
+    op.execute("""
+        INSERT INTO ticket_notes (ticket_db_id, guild_id, staff_id, note, created_at)
+        SELECT t.ticket_db_id, t.guild_id, n->>'staff_id',
+               COALESCE(n->>'note', n #>> '{}'),
+               COALESCE((n->>'created_at')::timestamp, now())
+        FROM tickets AS t, jsonb_array_elements(t.internal_notes) AS n
+        WHERE jsonb_typeof(t.internal_notes) = 'array'
+    """)
+
+    for column in AI_COLUMNS + ('internal_notes',):
+        op.drop_column('tickets', column)
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.add_column('tickets', sa.Column('initial_input_data', postgresql.JSONB()))
+    op.add_column('tickets', sa.Column('internal_notes', postgresql.JSONB()))
+    op.add_column('tickets', sa.Column('sentiment_score_history', postgresql.JSONB()))
+    op.add_column('tickets', sa.Column('ai_tags', postgresql.ARRAY(sa.String())))
+    op.add_column('tickets', sa.Column('ai_summary', sa.Text()))
+
+    op.execute(f"""
+        UPDATE tickets AS t
+        SET {', '.join(f'{column} = a.{column}' for column in AI_COLUMNS)}
+        FROM ticket_ai AS a
+        WHERE a.ticket_db_id = t.ticket_db_id AND a.guild_id = t.guild_id
+    """)
+    op.execute("""
+        UPDATE tickets AS t
+        SET internal_notes = n.notes
+        FROM (
+            SELECT ticket_db_id, guild_id,
+                   jsonb_agg(jsonb_build_object(
+                       'staff_id', staff_id, 'note', note, 'created_at', created_at
+                   ) ORDER BY created_at) AS notes
+            FROM ticket_notes
+            GROUP BY ticket_db_id, guild_id
+        ) AS n
+        WHERE n.ticket_db_id = t.ticket_db_id AND n.guild_id = t.guild_id
+    """)
+
+    op.drop_index('idx_ticket_notes_ticket')
+    op.drop_table('ticket_notes')
+    op.drop_table('ticket_ai')
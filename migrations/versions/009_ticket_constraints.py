@@ -0,0 +1,33 @@
+"""Add NOT NULL and CHECK constraints on frequently filtered ticket columns."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Backfill before tightening so existing rows don't violate the constraint
+    op.execute("UPDATE tickets SET status = 'open' WHERE status IS NULL")
+    op.alter_column('tickets', 'status', nullable=False, server_default='open')
+    op.alter_column('tickets', 'guild_id', nullable=False)
+    op.alter_column('tickets', 'channel_id', nullable=False)
+    op.alter_column('tickets', 'creator_id', nullable=False)
+
+    op.create_check_constraint(
+        'ck_ticket_feedback_rating_range',
+        'ticket_feedback',
+        sa.text('rating BETWEEN 1 AND 5')
+    )
+
+def downgrade():
+    op.drop_constraint('ck_ticket_feedback_rating_range', 'ticket_feedback', type_='check')
+    op.alter_column('tickets', 'status', nullable=True, server_default=None)
+    # channel_id and creator_id were already NOT NULL in 001, so they stay.
+    # guild_id was only NOT NULL where 007 partitioned tickets by it, and
+    # there it is part of the primary key.
+    if op.get_bind().dialect.name != 'postgresql':
+        op.alter_column('tickets', 'guild_id', nullable=True)
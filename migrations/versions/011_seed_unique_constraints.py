@@ -0,0 +1,22 @@
+"""Add per-guild unique names for categories and knowledge base articles."""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Lets the seed scripts insert with ON CONFLICT DO NOTHING
+    op.create_unique_constraint(
+        'uq_ticket_categories_guild_name', 'ticket_categories', ['guild_id', 'name']
+    )
+    op.create_unique_constraint(
+        'uq_knowledge_base_guild_title', 'knowledge_base', ['guild_id', 'title']
+    )
+
+def downgrade():
+    op.drop_constraint('uq_knowledge_base_guild_title', 'knowledge_base', type_='unique')
+    op.drop_constraint('uq_ticket_categories_guild_name', 'ticket_categories', type_='unique')
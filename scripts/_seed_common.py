@@ -0,0 +1,157 @@
+"""
+Shared helpers for the per-guild seed scripts.
+"""
+import asyncio
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.manager import DatabaseManager
+from database.models import Guild
+from utils.logger import get_logger
+
+logger = get_logger("seed")
+
+# Maximum number of guild batches seeded at once
+SEED_CONCURRENCY = 8
+
+# Number of guild rows fetched per round trip while streaming
+GUILD_FETCH_BATCH_SIZE = 100
+
+# Number of guilds written per transaction
+SEED_COMMIT_BATCH_SIZE = 50
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_DIALECT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert
+}
+
+# Seed-only durability settings: a crashed seed run is simply re-run, so
+# commits don't need to wait for fsync. SET LOCAL reverts at commit on
+# PostgreSQL.
+_RELAXED_DURABILITY = {
+    "postgresql": text("SET LOCAL synchronous_commit = OFF"),
+    "sqlite": text("PRAGMA synchronous = OFF")
+}
+
+# The SQLite pragma lasts for the whole connection, so it is set back to the
+# default before the connection returns to the pool
+_RESTORED_DURABILITY = {
+    "sqlite": text("PRAGMA synchronous = FULL")
+}
+
+# Seeds one guild inside the caller's transaction
+SeedGuild = Callable[[AsyncSession, str], Awaitable[None]]
+
+@lru_cache(maxsize=None)
+def _conflict_ignoring_insert(dialect: str, model, index_elements: Tuple[str, ...], returning: tuple):
+    """Build the base INSERT once per dialect so every guild reuses the same construct"""
+    if dialect not in _DIALECT_INSERTS:
+        raise NotImplementedError(f"Idempotent seeding is not supported on {dialect}")
+    stmt = _DIALECT_INSERTS[dialect](model).on_conflict_do_nothing(index_elements=list(index_elements))
+    return stmt.returning(*returning) if returning else stmt
+
+def insert_ignoring_conflicts(session: AsyncSession, model, index_elements: List[str], returning: Sequence = ()):
+    """Build an INSERT that skips rows colliding on the given unique columns"""
+    return _conflict_ignoring_insert(
+        session.bind.dialect.name, model, tuple(index_elements), tuple(returning)
+    )
+
+async def _seed_batch(db: DatabaseManager, seed_guild: SeedGuild, guild_ids: List[str]):
+    """Seed a batch of guilds in a single transaction"""
+    # Each batch gets its own connection and session; sessions can't be shared
+    # across concurrent awaits. Holding the connection keeps the durability
+    # settings and their reset on the same pooled connection.
+    async with db.engine.connect() as conn:
+        relax_durability = _RELAXED_DURABILITY.get(conn.dialect.name)
+        restore_durability = _RESTORED_DURABILITY.get(conn.dialect.name)
+        try:
+            async with db.Session(bind=conn) as session:
+                if relax_durability is not None:
+                    await session.execute(relax_durability)
+                for guild_id in guild_ids:
+                    logger.info(f"Processing guild: {guild_id}")
+                    await seed_guild(session, guild_id)
+                await session.commit()
+        finally:
+            if restore_durability is not None:
+                await conn.execute(restore_durability)
+                await conn.commit()
+
+async def _seed_worker(db: DatabaseManager, seed_guild: SeedGuild, queue: asyncio.Queue, failures: list):
+    """Seed guild batches taken from the queue until a None sentinel arrives"""
+    while (guild_ids := await queue.get()) is not None:
+        try:
+            await _seed_batch(db, seed_guild, guild_ids)
+        except Exception as e:
+            logger.error(f"Failed to seed batch of {len(guild_ids)} guild(s): {e}")
+            failures.extend(guild_ids)
+
+async def _seed_all_guilds(db: DatabaseManager, seed_guild: SeedGuild) -> int:
+    """
+    Stream batches of guild IDs into a bounded queue drained by a fixed set of
+    workers, so seeding starts before every guild row has been fetched.
+    Returns the number of guilds processed.
+    """
+    queue = asyncio.Queue(maxsize=SEED_CONCURRENCY * 2)
+    failures = []
+    workers = [
+        asyncio.create_task(_seed_worker(db, seed_guild, queue, failures))
+        for _ in range(SEED_CONCURRENCY)
+    ]
+    guild_count = 0
+
+    try:
+        async with db.Session() as session:
+            stmt = select(Guild.guild_id).execution_options(yield_per=GUILD_FETCH_BATCH_SIZE)
+            result = await session.stream(stmt)
+            # Group guilds so each commit covers a whole batch
+            async for batch in result.scalars().partitions(SEED_COMMIT_BATCH_SIZE):
+                await queue.put(batch)
+                guild_count += len(batch)
+    finally:
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+
+    if failures:
+        raise RuntimeError(f"Failed to seed {len(failures)} guild(s)")
+    return guild_count
+
+async def seed_per_guild(seed_guild: SeedGuild, *, guild_id: Optional[str] = None) -> bool:
+    """
+    Run seed_guild for the specified guild or every guild in the database.
+    Returns False if there was nothing to seed.
+    """
+    db = DatabaseManager()
+
+    try:
+        await db.initialize_database()
+
+        # Get target guilds
+        if guild_id:
+            # Only existence matters, so skip loading the full Guild entity
+            async with db.Session() as session:
+                exists = await session.scalar(
+                    select(Guild.guild_id).where(Guild.guild_id == guild_id).limit(1)
+                )
+            if exists is None:
+                logger.error(f"Guild {guild_id} not found in database.")
+                return False
+            await _seed_batch(db, seed_guild, [guild_id])
+        elif not await _seed_all_guilds(db, seed_guild):
+            logger.warning("No guilds found in database.")
+            return False
+
+        return True
+    finally:
+        await db.close()
@@ -4,39 +4,37 @@ Script to initialize default ticket categories and SLA definitions.
 import asyncio
 import sys
 from pathlib import Path
-import uuid
+from typing import NamedTuple
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database.manager import DatabaseManager
-from database.models import TicketCategory, Guild, SLADefinition
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import TicketCategory, SLADefinition, category_sla_rules
 from utils.logger import get_logger
+from _seed_common import insert_ignoring_conflicts, seed_per_guild
 
 logger = get_logger("init_categories")
 
-DEFAULT_CATEGORIES = [
+class ModalField(NamedTuple):
+    """A ticket creation modal field"""
+    id: str
+    label: str
+    style: str
+    required: bool
+    placeholder: str
+
+DEFAULT_CATEGORIES = (
     {
         "name": "General Support",
         "description": "General questions and assistance",
         "emoji": "❓",
-        "modal_fields": [
-            {
-                "id": "subject",
-                "label": "Subject",
-                "style": "short",
-                "required": True,
-                "placeholder": "Brief description of your issue"
-            },
-            {
-                "id": "description",
-                "label": "Description",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "Please provide details about your issue"
-            }
-        ],
+        "modal_fields": (
+            ModalField("subject", "Subject", "short", True, "Brief description of your issue"),
+            ModalField("description", "Description", "paragraph", True, "Please provide details about your issue")
+        ),
         "initial_message_template": (
             "Thank you for creating a ticket! A staff member will assist you shortly.\n\n"
             "**Category:** General Support\n"
@@ -53,36 +51,12 @@ DEFAULT_CATEGORIES = [
         "name": "Technical Support",
         "description": "Technical issues and troubleshooting",
         "emoji": "🔧",
-        "modal_fields": [
-            {
-                "id": "subject",
-                "label": "Subject",
-                "style": "short",
-                "required": True,
-                "placeholder": "Brief description of the technical issue"
-            },
-            {
-                "id": "platform",
-                "label": "Platform/Device",
-                "style": "short",
-                "required": True,
-                "placeholder": "OS/Device you're using (e.g., Windows 10, iPhone 13)"
-            },
-            {
-                "id": "description",
-                "label": "Description",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "Please describe the technical issue in detail"
-            },
-            {
-                "id": "steps",
-                "label": "Steps to Reproduce",
-                "style": "paragraph",
-                "required": False,
-                "placeholder": "Steps to reproduce the issue (if applicable)"
-            }
-        ],
+        "modal_fields": (
+            ModalField("subject", "Subject", "short", True, "Brief description of the technical issue"),
+            ModalField("platform", "Platform/Device", "short", True, "OS/Device you're using (e.g., Windows 10, iPhone 13)"),
+            ModalField("description", "Description", "paragraph", True, "Please describe the technical issue in detail"),
+            ModalField("steps", "Steps to Reproduce", "paragraph", False, "Steps to reproduce the issue (if applicable)")
+        ),
         "initial_message_template": (
             "Thank you for reporting this technical issue! Our support team will assist you shortly.\n\n"
             "**Category:** Technical Support\n"
@@ -102,36 +76,12 @@ DEFAULT_CATEGORIES = [
         "name": "Account Support",
         "description": "Account-related issues and requests",
         "emoji": "👤",
-        "modal_fields": [
-            {
-                "id": "subject",
-                "label": "Subject",
-                "style": "short",
-                "required": True,
-                "placeholder": "Brief description of your account issue"
-            },
-            {
-                "id": "account_id",
-                "label": "Account ID/Username",
-                "style": "short",
-                "required": True,
-                "placeholder": "Your account identifier"
-            },
-            {
-                "id": "description",
-                "label": "Description",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "Please describe your account issue in detail"
-            },
-            {
-                "id": "verification",
-                "label": "Verification Info",
-                "style": "paragraph",
-                "required": False,
-                "placeholder": "Any additional info to verify account ownership"
-            }
-        ],
+        "modal_fields": (
+            ModalField("subject", "Subject", "short", True, "Brief description of your account issue"),
+            ModalField("account_id", "Account ID/Username", "short", True, "Your account identifier"),
+            ModalField("description", "Description", "paragraph", True, "Please describe your account issue in detail"),
+            ModalField("verification", "Verification Info", "paragraph", False, "Any additional info to verify account ownership")
+        ),
         "initial_message_template": (
             "Thank you for contacting account support! We'll help you shortly.\n\n"
             "**Category:** Account Support\n"
@@ -148,36 +98,12 @@ DEFAULT_CATEGORIES = [
         "name": "Report User",
         "description": "Report violations or concerning behavior",
         "emoji": "🚨",
-        "modal_fields": [
-            {
-                "id": "subject",
-                "label": "Subject",
-                "style": "short",
-                "required": True,
-                "placeholder": "Brief description of the report"
-            },
-            {
-                "id": "reported_user",
-                "label": "Reported User",
-                "style": "short",
-                "required": True,
-                "placeholder": "ID or Username of reported user"
-            },
-            {
-                "id": "description",
-                "label": "Description",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "Please provide details about the incident"
-            },
-            {
-                "id": "evidence",
-                "label": "Evidence",
-                "style": "paragraph",
-                "required": False,
-                "placeholder": "Links to screenshots or other evidence"
-            }
-        ],
+        "modal_fields": (
+            ModalField("subject", "Subject", "short", True, "Brief description of the report"),
+            ModalField("reported_user", "Reported User", "short", True, "ID or Username of reported user"),
+            ModalField("description", "Description", "paragraph", True, "Please provide details about the incident"),
+            ModalField("evidence", "Evidence", "paragraph", False, "Links to screenshots or other evidence")
+        ),
         "initial_message_template": (
             "Thank you for submitting a report. Our moderation team will review it shortly.\n\n"
             "**Category:** User Report\n"
@@ -194,43 +120,13 @@ DEFAULT_CATEGORIES = [
         "name": "Bug Report",
         "description": "Report bugs and technical issues",
         "emoji": "🐛",
-        "modal_fields": [
-            {
-                "id": "subject",
-                "label": "Bug Title",
-                "style": "short",
-                "required": True,
-                "placeholder": "Brief description of the bug"
-            },
-            {
-                "id": "version",
-                "label": "Version",
-                "style": "short",
-                "required": True,
-                "placeholder": "Version where bug occurs"
-            },
-            {
-                "id": "description",
-                "label": "Description",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "Please describe the bug in detail"
-            },
-            {
-                "id": "steps",
-                "label": "Steps to Reproduce",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "1. Go to...\n2. Click on...\n3. Observe..."
-            },
-            {
-                "id": "expected",
-                "label": "Expected Behavior",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "What should happen?"
-            }
-        ],
+        "modal_fields": (
+            ModalField("subject", "Bug Title", "short", True, "Brief description of the bug"),
+            ModalField("version", "Version", "short", True, "Version where bug occurs"),
+            ModalField("description", "Description", "paragraph", True, "Please describe the bug in detail"),
+            ModalField("steps", "Steps to Reproduce", "paragraph", True, "1. Go to...\n2. Click on...\n3. Observe..."),
+            ModalField("expected", "Expected Behavior", "paragraph", True, "What should happen?")
+        ),
         "initial_message_template": (
             "Thank you for reporting this bug! Our development team will investigate.\n\n"
             "**Category:** Bug Report\n"
@@ -247,36 +143,12 @@ DEFAULT_CATEGORIES = [
         "name": "Feature Request",
         "description": "Suggest new features or improvements",
         "emoji": "💡",
-        "modal_fields": [
-            {
-                "id": "subject",
-                "label": "Feature Name",
-                "style": "short",
-                "required": True,
-                "placeholder": "Brief name for your feature suggestion"
-            },
-            {
-                "id": "description",
-                "label": "Description",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "Please describe the feature you'd like to suggest"
-            },
-            {
-                "id": "use_case",
-                "label": "Use Case",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "How and when would this feature be used?"
-            },
-            {
-                "id": "benefit",
-                "label": "Benefit",
-                "style": "paragraph",
-                "required": True,
-                "placeholder": "How would this feature benefit users?"
-            }
-        ],
+        "modal_fields": (
+            ModalField("subject", "Feature Name", "short", True, "Brief name for your feature suggestion"),
+            ModalField("description", "Description", "paragraph", True, "Please describe the feature you'd like to suggest"),
+            ModalField("use_case", "Use Case", "paragraph", True, "How and when would this feature be used?"),
+            ModalField("benefit", "Benefit", "paragraph", True, "How would this feature benefit users?")
+        ),
         "initial_message_template": (
             "Thank you for your feature suggestion! We'll review it carefully.\n\n"
             "**Category:** Feature Request\n"
@@ -289,79 +161,81 @@ DEFAULT_CATEGORIES = [
             "resolution": 4320  # 72 hours
         }
     }
-]
+)
 
-async def init_categories(guild_id: str = None):
-    """Initialize default ticket categories for specified guild or all guilds"""
-    db = DatabaseManager()
+# Per-category values unpacked once at import instead of once per guild;
+# names and emojis are interned since they're also used as lookup keys
+_CATEGORY_TEMPLATES = tuple(
+    (
+        sys.intern(cat_data["name"]),
+        cat_data["description"],
+        sys.intern(cat_data["emoji"]),
+        # Stored as JSON objects, so convert back to dicts once here
+        [field._asdict() for field in cat_data["modal_fields"]],
+        cat_data["initial_message_template"],
+        cat_data["sla"]["response"],
+        cat_data["sla"]["resolution"]
+    )
+    for cat_data in DEFAULT_CATEGORIES
+)
+
+async def seed_guild(session: AsyncSession, guild_id: str):
+    """Create the default categories and SLAs for a single guild"""
+    # Insert default categories in one statement; ones the guild already has
+    # are skipped by the (guild_id, name) unique constraint
+    category_rows = [
+        dict(
+            guild_id=guild_id,
+            name=name,
+            description=description,
+            emoji=emoji,
+            modal_fields=modal_fields,
+            initial_message_template=template
+        )
+        for name, description, emoji, modal_fields, template, _, _ in _CATEGORY_TEMPLATES
+    ]
+    stmt = insert_ignoring_conflicts(
+        session, TicketCategory, ["guild_id", "name"],
+        returning=(TicketCategory.name, TicketCategory.id)
+    ).values(category_rows)
+    inserted = dict((await session.execute(stmt)).all())
     
-    try:
-        await db.initialize_database()
-        
-        async with db.Session as session:
-            # Get target guilds
-            if guild_id:
-                guilds = [await session.get(Guild, guild_id)]
-                if not guilds[0]:
-                    logger.error(f"Guild {guild_id} not found in database.")
-                    return
-            else:
-                result = await session.execute("SELECT * FROM guilds")
-                guilds = result.all()
-                
-                if not guilds:
-                    logger.warning("No guilds found in database.")
-                    return
+    if not inserted:
+        logger.info(f"Guild {guild_id} already has the default categories.")
+        return
 
-            for guild in guilds:
-                logger.info(f"Processing guild: {guild.guild_id}")
-                
-                # Check existing categories
-                result = await session.execute(
-                    "SELECT COUNT(*) FROM ticket_categories WHERE guild_id = :guild_id",
-                    {"guild_id": guild.guild_id}
-                )
-                count = result.scalar()
-                
-                if count > 0:
-                    logger.info(f"Guild {guild.guild_id} already has {count} categories.")
-                    continue
+    # Create SLAs only for the categories that were actually inserted. Each
+    # SLA is named after its category so the generated ids can be matched back.
+    sla_rows = [
+        dict(
+            guild_id=guild_id,
+            name=name,
+            response_time=response,
+            resolution_time=resolution
+        )
+        for name, _, _, _, _, response, resolution in _CATEGORY_TEMPLATES
+        if name in inserted
+    ]
+    sla_ids = dict((await session.execute(
+        insert(SLADefinition).returning(SLADefinition.name, SLADefinition.id), sla_rows
+    )).all())
 
-                # Create default categories and SLAs
-                for cat_data in DEFAULT_CATEGORIES:
-                    # Create category
-                    category = TicketCategory(
-                        category_db_id=uuid.uuid4(),
-                        guild_id=guild.guild_id,
-                        name=cat_data["name"],
-                        description=cat_data["description"],
-                        emoji=cat_data["emoji"],
-                        modal_fields=cat_data["modal_fields"],
-                        initial_message_template=cat_data["initial_message_template"]
-                    )
-                    session.add(category)
-                    await session.flush()  # Get the ID
-                    
-                    # Create SLA definition
-                    sla = SLADefinition(
-                        sla_id=uuid.uuid4(),
-                        guild_id=guild.guild_id,
-                        category_db_id=category.category_db_id,
-                        response_sla_minutes=cat_data["sla"]["response"],
-                        resolution_sla_minutes=cat_data["sla"]["resolution"]
-                    )
-                    session.add(sla)
-                
-                await session.commit()
-                logger.info(f"✨ Created {len(DEFAULT_CATEGORIES)} categories for guild {guild.guild_id}")
+    # Link each category to its SLA
+    await session.execute(
+        insert(category_sla_rules),
+        [dict(category_id=inserted[name], sla_id=sla_id) for name, sla_id in sla_ids.items()]
+    )
+    
+    logger.info(f"✨ Created {len(inserted)} categories for guild {guild_id}")
 
-        logger.info("✨ Default categories initialized successfully!")
-        
+async def init_categories(guild_id: str = None):
+    """Initialize default ticket categories for specified guild or all guilds"""
+    try:
+        if await seed_per_guild(seed_guild, guild_id=guild_id):
+            logger.info("✨ Default categories initialized successfully!")
     except Exception as e:
         logger.error(f"Error initializing categories: {e}")
         raise
-    finally:
-        await db.close()
 
 def main():
     """Main entry point"""
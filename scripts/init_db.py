@@ -11,28 +11,27 @@ from utils.logger import logger
 async def create_default_data(session):
     """Create default data for testing"""
     try:
-        # Create default SLA definitions
-        default_sla = SLADefinition(
-            name="Standard SLA",
-            response_time=30,  # 30 minutes
-            resolution_time=1440  # 24 hours
-        )
-        session.add(default_sla)
-        
-        # Create default ticket categories
-        default_category = TicketCategory(
-            name="General Support",
-            description="General support inquiries"
-        )
-        default_category.sla_rules.append(default_sla)
-        session.add(default_category)
+        # Commits on clean exit and rolls back if anything below raises
+        async with session.begin():
+            # Create default SLA definitions
+            default_sla = SLADefinition(
+                name="Standard SLA",
+                response_time=30,  # 30 minutes
+                resolution_time=1440  # 24 hours
+            )
+            
+            # Create default ticket categories
+            default_category = TicketCategory(
+                name="General Support",
+                description="General support inquiries"
+            )
+            default_category.sla_rules.append(default_sla)
+            session.add_all([default_sla, default_category])
         
-        await session.commit()
         logger.info("✅ Created default data")
         
     except Exception as e:
         logger.error(f"❌ Error creating default data: {e}")
-        await session.rollback()
         raise
 
 async def init_database():
@@ -4,19 +4,19 @@ Script to initialize default knowledge base articles.
 import asyncio
 import sys
 from pathlib import Path
-import uuid
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database.manager import DatabaseManager
-from database.models import KnowledgeBase, Guild
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import KnowledgeBase
 from utils.logger import get_logger
+from _seed_common import insert_ignoring_conflicts, seed_per_guild
 
 logger = get_logger("init_kb")
 
-DEFAULT_ARTICLES = [
+DEFAULT_ARTICLES = (
     {
         "title": "Getting Started Guide",
         "content": """
@@ -174,68 +174,57 @@ A: Go to account settings and look for the security section.
         "category": "FAQ",
         "keywords": ["faq", "questions", "answers", "help", "common", "general"]
     }
-]
+)
+
+# Per-article values unpacked once at import instead of once per guild;
+# titles and categories are interned since they're also used as lookup keys
+_ARTICLE_TEMPLATES = tuple(
+    (
+        sys.intern(article_data["title"]),
+        article_data["content"],
+        sys.intern(article_data["category"]),
+        article_data["keywords"]
+    )
+    for article_data in DEFAULT_ARTICLES
+)
+
+async def seed_guild(session: AsyncSession, guild_id: str):
+    """Create the default knowledge base articles for a single guild"""
+    # Insert default articles in one statement; ones the guild already has
+    # are skipped by the (guild_id, title) unique constraint
+    now = datetime.utcnow()
+    articles = [
+        dict(
+            guild_id=guild_id,
+            title=title,
+            content=content,
+            category=category,
+            keywords=keywords,
+            created_by="SYSTEM",
+            created_at=now
+        )
+        for title, content, category, keywords in _ARTICLE_TEMPLATES
+    ]
+    stmt = insert_ignoring_conflicts(
+        session, KnowledgeBase, ["guild_id", "title"],
+        returning=(KnowledgeBase.article_id,)
+    ).values(articles)
+    created = len((await session.execute(stmt)).all())
+    
+    if not created:
+        logger.info(f"Guild {guild_id} already has the default KB articles.")
+        return
+    
+    logger.info(f"✨ Created {created} KB articles for guild {guild_id}")
 
 async def init_kb(guild_id: str = None):
     """Initialize default knowledge base articles for specified guild or all guilds"""
-    db = DatabaseManager()
-    
     try:
-        await db.initialize_database()
-        
-        async with db.Session as session:
-            # Get target guilds
-            if guild_id:
-                guilds = [await session.get(Guild, guild_id)]
-                if not guilds[0]:
-                    logger.error(f"Guild {guild_id} not found in database.")
-                    return
-            else:
-                result = await session.execute("SELECT * FROM guilds")
-                guilds = result.all()
-                
-                if not guilds:
-                    logger.warning("No guilds found in database.")
-                    return
-
-            for guild in guilds:
-                logger.info(f"Processing guild: {guild.guild_id}")
-                
-                # Check existing articles
-                result = await session.execute(
-                    "SELECT COUNT(*) FROM knowledge_base WHERE guild_id = :guild_id",
-                    {"guild_id": guild.guild_id}
-                )
-                count = result.scalar()
-                
-                if count > 0:
-                    logger.info(f"Guild {guild.guild_id} already has {count} KB articles.")
-                    continue
-
-                # Create default articles
-                for article_data in DEFAULT_ARTICLES:
-                    article = KnowledgeBase(
-                        article_id=uuid.uuid4(),
-                        guild_id=guild.guild_id,
-                        title=article_data["title"],
-                        content=article_data["content"],
-                        category=article_data["category"],
-                        keywords=article_data["keywords"],
-                        created_by="SYSTEM",
-                        created_at=datetime.utcnow()
-                    )
-                    session.add(article)
-                
-                await session.commit()
-                logger.info(f"✨ Created {len(DEFAULT_ARTICLES)} KB articles for guild {guild.guild_id}")
-
-        logger.info("✨ Default knowledge base articles initialized successfully!")
-        
+        if await seed_per_guild(seed_guild, guild_id=guild_id):
+            logger.info("✨ Default knowledge base articles initialized successfully!")
     except Exception as e:
         logger.error(f"Error initializing knowledge base: {e}")
         raise
-    finally:
-        await db.close()
 
 def main():
     """Main entry point"""
@@ -2,17 +2,29 @@
 Utility functions and modules for the bot.
 """
 import logging
-from rich.logging import RichHandler
+from functools import lru_cache
+
+_CONFIGURED = False
+
+def setup_logging(force: bool = False):
+    """Configure the logging system once; pass force=True to reconfigure."""
+    global _CONFIGURED
+    if _CONFIGURED and not force:
+        return
+    _CONFIGURED = True
+
+    # Imported here so get_logger-only callers never load rich
+    from rich.logging import RichHandler
 
-def setup_logging():
-    """Configure the logging system."""
     logging.basicConfig(
         level=logging.INFO,
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(rich_tracebacks=True)]
+        handlers=[RichHandler(rich_tracebacks=True)],
+        force=True
     )
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = "nexon") -> logging.Logger:
     """Get a logger instance with the specified name."""
     return logging.getLogger(name) 
\ No newline at end of file
@@ -3,22 +3,48 @@ AI utilities for sentiment analysis, tag generation, and ticket summarization.
 """
 from typing import List, Dict, Any, Tuple, Optional
 import re
-from textblob import TextBlob
-from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 from collections import Counter
-import nltk
+from functools import lru_cache
+from itertools import chain
+import heapq
 from datetime import datetime
 import json
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+# NLTK and its data are loaded on first use rather than at import, so
+# importing this module stays cheap
+@lru_cache(maxsize=1)
+def _stopwords() -> frozenset:
+    """English stopwords"""
+    import nltk
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+@lru_cache(maxsize=1)
+def _sentence_tokenizer():
+    """Punkt sentence tokenizer, built once; sent_tokenize rebuilds it on every call"""
+    import nltk
+    try:
+        from nltk.tokenize import PunktTokenizer
+    except ImportError:
+        # NLTK releases before PunktTokenizer ship a pickled model instead
+        try:
+            nltk.data.find('tokenizers/punkt')
+        except LookupError:
+            nltk.download('punkt')
+        return nltk.data.load('tokenizers/punkt/english.pickle')
+    try:
+        return PunktTokenizer('english')
+    except LookupError:
+        nltk.download('punkt_tab')
+        return PunktTokenizer('english')
+
+# Word tokenizer; callers only keep alphanumeric tokens, so Punkt and the
+# Treebank rules behind nltk.word_tokenize aren't needed
+_WORD_RE = re.compile(r'\w+')
 
 # Common technical support keywords and their categories
 TECH_KEYWORDS = {
@@ -58,34 +84,31 @@ TECH_KEYWORDS = {
     'browser': 'platform'
 }
 
-def analyze_sentiment(text: str) -> Tuple[float, str]:
-    """
-    Analyze the sentiment of text and return a score and label.
-    
-    Args:
-        text: The text to analyze
-        
-    Returns:
-        Tuple of (sentiment_score, sentiment_label)
-        Score ranges from -1 (very negative) to 1 (very positive)
-        Label is one of: 'very negative', 'negative', 'neutral', 'positive', 'very positive'
-    """
-    blob = TextBlob(text)
-    sentiment_score = blob.sentiment.polarity
-    
-    # Map score to label
-    if sentiment_score <= -0.6:
-        label = 'very negative'
-    elif sentiment_score <= -0.2:
-        label = 'negative'
-    elif sentiment_score <= 0.2:
-        label = 'neutral'
-    elif sentiment_score <= 0.6:
-        label = 'positive'
-    else:
-        label = 'very positive'
-        
-    return sentiment_score, label
+PLATFORM_KEYWORDS = ('windows', 'mac', 'android', 'ios', 'linux', 'mobile', 'desktop', 'browser')
+HIGH_PRIORITY_KEYWORDS = frozenset({'urgent', 'critical', 'emergency', 'asap'})
+LOW_PRIORITY_KEYWORDS = frozenset({'minor', 'small', 'trivial'})
+
+# Tags contributed by each keyword
+_KEYWORD_TAGS: Dict[str, set] = {}
+for _platform in PLATFORM_KEYWORDS:
+    _KEYWORD_TAGS.setdefault(_platform, set()).add(_platform)
+for _keyword, _tag_category in TECH_KEYWORDS.items():
+    _KEYWORD_TAGS.setdefault(_keyword, set()).add(_tag_category)
+for _keyword in HIGH_PRIORITY_KEYWORDS | LOW_PRIORITY_KEYWORDS:
+    _KEYWORD_TAGS.setdefault(_keyword, set())
+
+# Finds every tag keyword in a single pass. The lookahead makes matches
+# zero-width so overlapping keywords are all reported, matching the
+# previous substring checks. Only the longest keyword starting at a
+# position is captured, so each keyword also maps to the shorter
+# keywords it begins with.
+_TAG_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in sorted(_KEYWORD_TAGS, key=len, reverse=True)) + '))'
+)
+_KEYWORD_PREFIXES = {
+    keyword: frozenset(other for other in _KEYWORD_TAGS if keyword.startswith(other))
+    for keyword in _KEYWORD_TAGS
+}
 
 def generate_ticket_tags(text: str, category: str) -> List[str]:
     """
@@ -104,21 +127,17 @@ def generate_ticket_tags(text: str, category: str) -> List[str]:
     # Start with category as a tag
     tags = {category.lower()}
     
-    # Add platform tags
-    platforms = ['windows', 'mac', 'android', 'ios', 'linux', 'mobile', 'desktop', 'browser']
-    for platform in platforms:
-        if platform in text:
-            tags.add(platform)
-    
-    # Add tags based on technical keywords
-    for keyword, tag_category in TECH_KEYWORDS.items():
-        if keyword in text:
-            tags.add(tag_category)
+    # Find platform, technical and severity keywords in one scan
+    keywords = set()
+    for match in _TAG_KEYWORD_RE.finditer(text):
+        keywords |= _KEYWORD_PREFIXES[match.group(1)]
+    for keyword in keywords:
+        tags.update(_KEYWORD_TAGS[keyword])
     
     # Add severity tag if found
-    if any(word in text for word in ['urgent', 'critical', 'emergency', 'asap']):
+    if keywords & HIGH_PRIORITY_KEYWORDS:
         tags.add('high-priority')
-    elif any(word in text for word in ['minor', 'small', 'trivial']):
+    elif keywords & LOW_PRIORITY_KEYWORDS:
         tags.add('low-priority')
     
     return sorted(list(tags))
@@ -138,7 +157,7 @@ def summarize_ticket(messages: List[Dict[str, Any]], max_sentences: int = 3) ->
     full_text = ' '.join(msg['content'] for msg in messages)
     
     # Tokenize into sentences
-    sentences = sent_tokenize(full_text)
+    sentences = _sentence_tokenizer().tokenize(full_text)
     
     if not sentences:
         return "No content to summarize."
@@ -147,37 +166,33 @@ def summarize_ticket(messages: List[Dict[str, Any]], max_sentences: int = 3) ->
     if len(sentences) <= max_sentences:
         return ' '.join(sentences)
     
+    # Tokenize each sentence once for both counting and scoring
+    sentence_words = [
+        [word for word in _WORD_RE.findall(sentence.lower()) if word.isalnum()]
+        for sentence in sentences
+    ]
+    
     # Calculate sentence scores based on word frequency
-    stop_words = set(stopwords.words('english'))
-    word_freq = Counter()
-    
-    for sentence in sentences:
-        words = word_tokenize(sentence.lower())
-        words = [word for word in words if word.isalnum() and word not in stop_words]
-        word_freq.update(words)
-    
-    # Score sentences based on word frequency
-    sentence_scores = []
-    for sentence in sentences:
-        score = 0
-        words = word_tokenize(sentence.lower())
-        words = [word for word in words if word.isalnum()]
-        for word in words:
-            score += word_freq[word]
-        sentence_scores.append((score, sentence))
-    
-    # Get top sentences
-    top_sentences = sorted(sentence_scores, reverse=True)[:max_sentences]
+    stop_words = _stopwords()
+    word_freq = Counter(word for word in chain.from_iterable(sentence_words) if word not in stop_words)
+    
+    # Score sentences based on word frequency; stopwords count as zero
+    sentence_scores = [
+        (sum(map(word_freq.__getitem__, words)), sentence)
+        for words, sentence in zip(sentence_words, sentences)
+    ]
+    
+    # Get top sentences without sorting all of them; picking indices keeps
+    # repeated sentences apart
+    top_indices = heapq.nlargest(max_sentences, range(len(sentences)), key=sentence_scores.__getitem__)
     
     # Sort sentences by their original order
-    summary_sentences = []
-    for sentence in sentences:
-        if any(sentence == s[1] for s in top_sentences):
-            summary_sentences.append(sentence)
-        if len(summary_sentences) == max_sentences:
-            break
-    
-    return ' '.join(summary_sentences)
+    return ' '.join(sentences[index] for index in sorted(top_indices))
+
+@lru_cache(maxsize=1024)
+def _macro_keywords(macro_id: str, content: str) -> frozenset:
+    """Keywords of a macro; the content is part of the key so edits aren't served stale"""
+    return frozenset(_WORD_RE.findall(content.lower())) - _stopwords()
 
 def suggest_macro_response(
     ticket_content: str,
@@ -198,18 +213,13 @@ def suggest_macro_response(
     
     # Convert ticket content to lowercase for matching
     ticket_content = ticket_content.lower()
+    ticket_words = frozenset(_WORD_RE.findall(ticket_content)) - _stopwords()
     
     # Calculate relevance scores for each macro
     macro_scores = []
     for macro in available_macros:
-        score = 0
-        macro_content = macro['content'].lower()
-        
         # Check for keyword matches
-        keywords = set(word_tokenize(macro_content)) - set(stopwords.words('english'))
-        for keyword in keywords:
-            if keyword in ticket_content:
-                score += 1
+        score = len(_macro_keywords(macro['macro_id'], macro['content']) & ticket_words)
         
         # Boost score for category matches
         if macro.get('category', '').lower() in ticket_content:
@@ -226,6 +236,13 @@ def suggest_macro_response(
     
     return None
 
+# Patterns used by extract_key_details
+_ERROR_CODE_RE = re.compile(r'(?:error|code)[\s:]*([\w-]+)', re.I)
+_VERSION_RE = re.compile(r'v?(\d+\.\d+(?:\.\d+)?(?:-\w+)?)')
+_URL_RE = re.compile(r'https?://\S+')
+_EMAIL_RE = re.compile(r'\b[\w\.-]+@[\w\.-]+\.\w+\b')
+_ID_RE = re.compile(r'(?:id|user|account)[\s:]*([\w-]{4,})', re.I)
+
 def extract_key_details(text: str) -> Dict[str, str]:
     """
     Extract key details from ticket content like error codes, versions, etc.
@@ -239,32 +256,50 @@ def extract_key_details(text: str) -> Dict[str, str]:
     details = {}
     
     # Extract error codes (common formats)
-    error_codes = re.findall(r'(?:error|code)[\s:]*([\w-]+)', text, re.I)
+    error_codes = _ERROR_CODE_RE.findall(text)
     if error_codes:
         details['error_codes'] = error_codes
     
     # Extract versions (common formats)
-    versions = re.findall(r'v?(\d+\.\d+(?:\.\d+)?(?:-\w+)?)', text)
+    versions = _VERSION_RE.findall(text)
     if versions:
         details['versions'] = versions
     
     # Extract URLs
-    urls = re.findall(r'https?://\S+', text)
+    urls = _URL_RE.findall(text)
     if urls:
         details['urls'] = urls
     
     # Extract email addresses
-    emails = re.findall(r'\b[\w\.-]+@[\w\.-]+\.\w+\b', text)
+    emails = _EMAIL_RE.findall(text)
     if emails:
         details['emails'] = emails
     
     # Extract IDs (common formats)
-    ids = re.findall(r'(?:id|user|account)[\s:]*([\w-]{4,})', text, re.I)
+    ids = _ID_RE.findall(text)
     if ids:
         details['ids'] = ids
     
     return details
 
+# Common issue patterns and their regular expressions
+ISSUE_PATTERNS = {
+    'login_problem': r'(?i)(can\'?t\s+log\s*in|login\s+(?:failed|error|problem)|password\s+(?:reset|problem|incorrect))',
+    'connection_issue': r'(?i)(can\'?t\s+connect|connection\s+(?:failed|lost|problem)|disconnected|timeout)',
+    'performance_problem': r'(?i)(slow|lag(?:ging)?|freeze|stuck|crash|performance\s+(?:issue|problem))',
+    'error_message': r'(?i)(error\s+(?:message|code)|exception|failed\s+to|unable\s+to)',
+    'feature_request': r'(?i)((?:new\s+)?feature\s+request|suggestion|would\s+(?:like|be\s+nice)\s+(?:to\s+have|if))',
+    'bug_report': r'(?i)(bug|not\s+working|broken|incorrect\s+(?:behavior|behaviour)|unexpected)',
+    'account_issue': r'(?i)(account\s+(?:problem|locked|suspended|banned)|can\'?t\s+access\s+(?:my\s+)?account)',
+    'billing_problem': r'(?i)(payment|charge|refund|subscription|billing|invoice)',
+    'data_loss': r'(?i)(lost\s+(?:data|progress|files)|missing\s+(?:data|files)|deleted|corrupted)',
+    'update_problem': r'(?i)(update|upgrade|installation|version|patch)\s+(?:failed|error|problem|issue)'
+}
+
+# Compiled once per issue type. Each pattern keeps its own scan so matches that
+# overlap another issue type's still count toward both.
+_ISSUE_RES = {issue_type: re.compile(pattern) for issue_type, pattern in ISSUE_PATTERNS.items()}
+
 def analyze_common_issues(ticket_content: str) -> Dict[str, float]:
     """
     Analyze ticket content to identify common issues and their confidence scores.
@@ -275,27 +310,12 @@ def analyze_common_issues(ticket_content: str) -> Dict[str, float]:
     Returns:
         Dict mapping issue types to confidence scores (0-1)
     """
-    # Common issue patterns and their regular expressions
-    ISSUE_PATTERNS = {
-        'login_problem': r'(?i)(can\'?t\s+log\s*in|login\s+(?:failed|error|problem)|password\s+(?:reset|problem|incorrect))',
-        'connection_issue': r'(?i)(can\'?t\s+connect|connection\s+(?:failed|lost|problem)|disconnected|timeout)',
-        'performance_problem': r'(?i)(slow|lag(?:ging)?|freeze|stuck|crash|performance\s+(?:issue|problem))',
-        'error_message': r'(?i)(error\s+(?:message|code)|exception|failed\s+to|unable\s+to)',
-        'feature_request': r'(?i)((?:new\s+)?feature\s+request|suggestion|would\s+(?:like|be\s+nice)\s+(?:to\s+have|if))',
-        'bug_report': r'(?i)(bug|not\s+working|broken|incorrect\s+(?:behavior|behaviour)|unexpected)',
-        'account_issue': r'(?i)(account\s+(?:problem|locked|suspended|banned)|can\'?t\s+access\s+(?:my\s+)?account)',
-        'billing_problem': r'(?i)(payment|charge|refund|subscription|billing|invoice)',
-        'data_loss': r'(?i)(lost\s+(?:data|progress|files)|missing\s+(?:data|files)|deleted|corrupted)',
-        'update_problem': r'(?i)(update|upgrade|installation|version|patch)\s+(?:failed|error|problem|issue)'
-    }
-    
     # Initialize results
     results = {}
     
     # Calculate confidence scores based on pattern matches
-    for issue_type, pattern in ISSUE_PATTERNS.items():
-        matches = re.finditer(pattern, ticket_content)
-        match_count = sum(1 for _ in matches)
+    for issue_type, pattern in _ISSUE_RES.items():
+        match_count = sum(1 for _ in pattern.finditer(ticket_content))
         
         # Calculate confidence score (0-1)
         # More matches = higher confidence, but with diminishing returns
@@ -306,6 +326,43 @@ def analyze_common_issues(ticket_content: str) -> Dict[str, float]:
     
     return results
 
+# Patterns used by extract_key_information
+# Platforms in priority order, fused into one regex with a named group each.
+# The alternation sits inside a lookahead so every position is tried, and a
+# lower-priority match can't consume text a higher-priority one starts in.
+PLATFORM_PATTERNS = {
+    'windows': r'windows\s+(?:\d+|xp|vista|[78]|10|11)',
+    'mac': r'mac\s*os|macos|osx',
+    'linux': r'linux|ubuntu|debian|fedora|centos',
+    'ios': r'ios\s+\d+|iphone|ipad',
+    'android': r'android(?:\s+\d+)?'
+}
+_PLATFORM_RE = re.compile(
+    '(?=(?:' + '|'.join(f'(?P<{platform}>{pattern})' for platform, pattern in PLATFORM_PATTERNS.items()) + '))',
+    re.IGNORECASE
+)
+_PLATFORM_PRIORITY = {platform: rank for rank, platform in enumerate(PLATFORM_PATTERNS)}
+_VERSION_INFO_RE = re.compile(r'(?i)v?ersion\s*[:\s]\s*(\d+(?:\.\d+)*)')
+_ERROR_INFO_RE = re.compile(r'(?i)error(?:\s+code)?[:\s]\s*([A-Z0-9-_]+)')
+_TIMESTAMP_RE = re.compile(r'(?i)(?:at|on)\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}(?::\d{2})?)')
+_USER_ID_RE = re.compile(r'(?i)(?:user|id)[:\s]\s*(\d{5,})')
+
+def detect_platform(text: str) -> Optional[str]:
+    """
+    Detect the platform mentioned in text in a single scan.
+    
+    Args:
+        text: The text to analyze
+        
+    Returns:
+        The highest-priority platform mentioned, or None
+    """
+    return min(
+        (match.lastgroup for match in _PLATFORM_RE.finditer(text)),
+        key=_PLATFORM_PRIORITY.__getitem__,
+        default=None
+    )
+
 def extract_key_information(ticket_content: str) -> Dict[str, str]:
     """
     Extract key information from ticket content.
@@ -325,36 +382,25 @@ def extract_key_information(ticket_content: str) -> Dict[str, str]:
     }
     
     # Platform detection
-    platform_patterns = {
-        'windows': r'(?i)windows\s+(?:\d+|xp|vista|[78]|10|11)',
-        'mac': r'(?i)mac\s*os|macos|osx',
-        'linux': r'(?i)linux|ubuntu|debian|fedora|centos',
-        'ios': r'(?i)ios\s+\d+|iphone|ipad',
-        'android': r'(?i)android\s+\d+|android'
-    }
-    
-    for platform, pattern in platform_patterns.items():
-        if re.search(pattern, ticket_content):
-            info['platform'] = platform
-            break
+    info['platform'] = detect_platform(ticket_content)
     
     # Version number
-    version_match = re.search(r'(?i)v?ersion\s*[:\s]\s*(\d+(?:\.\d+)*)', ticket_content)
+    version_match = _VERSION_INFO_RE.search(ticket_content)
     if version_match:
         info['version'] = version_match.group(1)
     
     # Error code
-    error_match = re.search(r'(?i)error(?:\s+code)?[:\s]\s*([A-Z0-9-_]+)', ticket_content)
+    error_match = _ERROR_INFO_RE.search(ticket_content)
     if error_match:
         info['error_code'] = error_match.group(1)
     
     # Timestamp
-    timestamp_match = re.search(r'(?i)(?:at|on)\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}(?::\d{2})?)', ticket_content)
+    timestamp_match = _TIMESTAMP_RE.search(ticket_content)
     if timestamp_match:
         info['timestamp'] = timestamp_match.group(1)
     
     # User ID
-    user_id_match = re.search(r'(?i)(?:user|id)[:\s]\s*(\d{5,})', ticket_content)
+    user_id_match = _USER_ID_RE.search(ticket_content)
     if user_id_match:
         info['user_id'] = user_id_match.group(1)
     
@@ -485,6 +531,19 @@ def generate_suggested_response(
     
     return response
 
+# Sentiment word lists
+POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+    'helpful', 'perfect', 'thanks', 'thank', 'appreciate', 'pleased',
+    'happy', 'love', 'awesome', 'best', 'satisfied', 'glad'
+})
+
+NEGATIVE_WORDS = frozenset({
+    'bad', 'poor', 'terrible', 'horrible', 'awful', 'worst',
+    'unhappy', 'disappointed', 'frustrating', 'useless', 'waste',
+    'annoying', 'hate', 'problem', 'issue', 'error', 'bug', 'crash'
+})
+
 def analyze_sentiment(ticket_content: str) -> Tuple[str, float]:
     """
     Analyze the sentiment of ticket content.
@@ -496,25 +555,14 @@ def analyze_sentiment(ticket_content: str) -> Tuple[str, float]:
         Tuple of (sentiment, confidence) where sentiment is one of:
         'positive', 'negative', 'neutral'
     """
-    # Sentiment word lists
-    POSITIVE_WORDS = {
-        'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
-        'helpful', 'perfect', 'thanks', 'thank', 'appreciate', 'pleased',
-        'happy', 'love', 'awesome', 'best', 'satisfied', 'glad'
-    }
-    
-    NEGATIVE_WORDS = {
-        'bad', 'poor', 'terrible', 'horrible', 'awful', 'worst',
-        'unhappy', 'disappointed', 'frustrating', 'useless', 'waste',
-        'annoying', 'hate', 'problem', 'issue', 'error', 'bug', 'crash'
-    }
-    
     # Convert to lowercase and split into words
-    words = re.findall(r'\w+', ticket_content.lower())
+    words = _WORD_RE.findall(ticket_content.lower())
     
-    # Count sentiment words
-    positive_count = sum(1 for word in words if word in POSITIVE_WORDS)
-    negative_count = sum(1 for word in words if word in NEGATIVE_WORDS)
+    # Count sentiment words in a single pass
+    positive_count = negative_count = 0
+    for word in words:
+        positive_count += word in POSITIVE_WORDS
+        negative_count += word in NEGATIVE_WORDS
     total_count = positive_count + negative_count
     
     if total_count == 0:
@@ -532,6 +580,52 @@ def analyze_sentiment(ticket_content: str) -> Tuple[str, float]:
     else:
         return ('neutral', 0.5)
 
+# Priority indicators
+URGENT_PATTERNS = (
+    r'urgent',
+    r'emergency',
+    r'critical',
+    r'immediate',
+    r'asap',
+    r'production.*down',
+    r'security.*breach',
+    r'data.*breach'
+)
+
+HIGH_PATTERNS = (
+    r'important',
+    r'serious',
+    r'significant',
+    r'major',
+    r'production.*issue',
+    r'customer.*impact'
+)
+
+MEDIUM_PATTERNS = (
+    r'moderate',
+    r'minor',
+    r'regular',
+    r'normal',
+    r'standard'
+)
+
+def _compile_priority_tier(patterns: Tuple[str, ...]) -> re.Pattern:
+    """
+    Fuse a tier's patterns into one regex. Each pattern gets its own named
+    group inside a lookahead, so one scan reports every pattern that
+    matches anywhere, even where matches overlap.
+    """
+    alternatives = '|'.join(f'(?P<p{index}>{pattern})' for index, pattern in enumerate(patterns))
+    return re.compile(f'(?=(?:{alternatives}))', re.IGNORECASE)
+
+_URGENT_RE = _compile_priority_tier(URGENT_PATTERNS)
+_HIGH_RE = _compile_priority_tier(HIGH_PATTERNS)
+_MEDIUM_RE = _compile_priority_tier(MEDIUM_PATTERNS)
+
+def _count_matched_patterns(tier_re: re.Pattern, text: str) -> int:
+    """Count how many of a tier's patterns occur in the text"""
+    return len({match.lastgroup for match in tier_re.finditer(text)})
+
 def categorize_priority(
     ticket_content: str,
     sentiment: Tuple[str, float]
@@ -547,39 +641,10 @@ def categorize_priority(
         Tuple of (priority, confidence) where priority is one of:
         'low', 'medium', 'high', 'urgent'
     """
-    # Priority indicators
-    URGENT_PATTERNS = {
-        r'(?i)urgent',
-        r'(?i)emergency',
-        r'(?i)critical',
-        r'(?i)immediate',
-        r'(?i)asap',
-        r'(?i)production.*down',
-        r'(?i)security.*breach',
-        r'(?i)data.*breach'
-    }
-    
-    HIGH_PATTERNS = {
-        r'(?i)important',
-        r'(?i)serious',
-        r'(?i)significant',
-        r'(?i)major',
-        r'(?i)production.*issue',
-        r'(?i)customer.*impact'
-    }
-    
-    MEDIUM_PATTERNS = {
-        r'(?i)moderate',
-        r'(?i)minor',
-        r'(?i)regular',
-        r'(?i)normal',
-        r'(?i)standard'
-    }
-    
-    # Check for urgent patterns
-    urgent_matches = sum(1 for pattern in URGENT_PATTERNS if re.search(pattern, ticket_content))
-    high_matches = sum(1 for pattern in HIGH_PATTERNS if re.search(pattern, ticket_content))
-    medium_matches = sum(1 for pattern in MEDIUM_PATTERNS if re.search(pattern, ticket_content))
+    # Count matching patterns per tier
+    urgent_matches = _count_matched_patterns(_URGENT_RE, ticket_content)
+    high_matches = _count_matched_patterns(_HIGH_RE, ticket_content)
+    medium_matches = _count_matched_patterns(_MEDIUM_RE, ticket_content)
     
     # Factor in sentiment
     sentiment_type, sentiment_conf = sentiment
@@ -1,52 +1,109 @@
 import os
+import asyncio
+import heapq
 import logging
+import re
+from collections import Counter
+from functools import lru_cache
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 import openai
-from typing import List, Dict, Optional, Tuple
+from typing import FrozenSet, List, Dict, Optional, Tuple
 
 # Initialize logging
 logger = logging.getLogger("nexon.ai")
 
+# Keyword tokenizer; only alphanumeric tokens are kept, so NLTK's
+# word_tokenize (and the Punkt data it needs) isn't required
+_TOKEN_RE = re.compile(r"\w+")
+
 # Download required NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
     nltk.data.find('sentiment/vader_lexicon.zip')
     nltk.data.find('corpora/stopwords')
 except LookupError:
-    nltk.download('punkt')
     nltk.download('vader_lexicon')
     nltk.download('stopwords')
 
+@lru_cache(maxsize=1024)
+def _keywords_cached(text: str, stop_words: FrozenSet[str]) -> FrozenSet[str]:
+    """Keyword set of a text; the same ticket text is usually analyzed several times in a row"""
+    tokens = _TOKEN_RE.findall(text.lower())
+    return frozenset(word for word in tokens if word not in stop_words and word.isalnum())
+
 class AIFeatures:
     def __init__(self):
         self.sia = SentimentIntensityAnalyzer()
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = frozenset(stopwords.words('english'))
+        # Keyword sets of KB articles and macros, keyed by their ID
+        self._kw_cache: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+        # Inverted keyword -> positions index per collection, with the
+        # (id, content) pairs it was built from
+        self._index_cache: Dict[str, Tuple[tuple, Dict[str, List[int]]]] = {}
         openai.api_key = os.getenv("OPENAI_API_KEY")
 
+    def _analyze_sentiment_sync(self, text: str) -> Dict[str, float]:
+        """Score text with VADER"""
+        scores = self.sia.polarity_scores(text)
+        return {
+            "compound": scores["compound"],
+            "positive": scores["pos"],
+            "negative": scores["neg"],
+            "neutral": scores["neu"]
+        }
+
     async def analyze_sentiment(self, text: str) -> Dict[str, float]:
         """Analyze the sentiment of a text message"""
         try:
-            scores = self.sia.polarity_scores(text)
-            return {
-                "compound": scores["compound"],
-                "positive": scores["pos"],
-                "negative": scores["neg"],
-                "neutral": scores["neu"]
-            }
+            # CPU-bound; run it off the event loop
+            return await asyncio.to_thread(self._analyze_sentiment_sync, text)
         except Exception as e:
             logger.error(f"Error in sentiment analysis: {e}")
             return {"compound": 0, "positive": 0, "negative": 0, "neutral": 1}
 
+    def _extract_sync(self, text: str) -> FrozenSet[str]:
+        """Tokenize text and drop stopwords and punctuation"""
+        return _keywords_cached(text, self.stop_words)
+
+    def _kw_set(self, key: str, content: str) -> FrozenSet[str]:
+        """Get the keyword set of a stored article or macro, re-extracting only when its content changed"""
+        cached = self._kw_cache.get(key)
+        if cached is None or cached[0] != content:
+            cached = (content, self._extract_sync(content))
+            self._kw_cache[key] = cached
+        return cached[1]
+
+    def _keyword_index(self, kind: str, items: List[Dict], id_field: str) -> Dict[str, List[int]]:
+        """Map each keyword to the positions of the items containing it, rebuilding when the items change"""
+        signature = tuple((item[id_field], item["content"]) for item in items)
+        cached = self._index_cache.get(kind)
+        if cached is None or cached[0] != signature:
+            postings: Dict[str, List[int]] = {}
+            for position, (item_id, content) in enumerate(signature):
+                for keyword in self._kw_set(f"{kind}:{item_id}", content):
+                    postings.setdefault(keyword, []).append(position)
+            cached = (signature, postings)
+            self._index_cache[kind] = cached
+        return cached[1]
+
+    def _top_matches(self, text: str, kind: str, items: List[Dict], id_field: str, limit: int = 3) -> List[Tuple[int, int]]:
+        """Return (position, score) of the items sharing the most keywords with text"""
+        postings = self._keyword_index(kind, items, id_field)
+        
+        # Only items sharing at least one keyword with the text get a score
+        scores = Counter()
+        for keyword in self._extract_sync(text):
+            scores.update(postings.get(keyword, ()))
+        
+        # Highest score first; ties keep the items' original order
+        return heapq.nlargest(limit, scores.items(), key=lambda match: (match[1], -match[0]))
+
     async def extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from text"""
         try:
-            # Tokenize and remove stopwords
-            tokens = word_tokenize(text.lower())
-            keywords = [word for word in tokens if word not in self.stop_words and word.isalnum()]
-            return list(set(keywords))  # Remove duplicates
+            # CPU-bound; run it off the event loop
+            return list(await asyncio.to_thread(self._extract_sync, text))
         except Exception as e:
             logger.error(f"Error in keyword extraction: {e}")
             return []
@@ -54,22 +111,11 @@ class AIFeatures:
     async def suggest_kb_articles(self, text: str, kb_articles: List[Dict]) -> List[Dict]:
         """Suggest relevant knowledge base articles based on text content"""
         try:
-            # Extract keywords from the text
-            text_keywords = await self.extract_keywords(text)
-            
-            # Score each article based on keyword matches
-            scored_articles = []
-            for article in kb_articles:
-                article_keywords = await self.extract_keywords(article["content"])
-                score = len(set(text_keywords) & set(article_keywords))
-                if score > 0:
-                    scored_articles.append({
-                        "article": article,
-                        "score": score
-                    })
-            
-            # Sort by score and return top matches
-            return sorted(scored_articles, key=lambda x: x["score"], reverse=True)[:3]
+            # Score articles by the keywords they share with the text
+            return [
+                {"article": kb_articles[position], "score": score}
+                for position, score in self._top_matches(text, "kb", kb_articles, "article_id")
+            ]
         except Exception as e:
             logger.error(f"Error in KB article suggestion: {e}")
             return []
@@ -95,25 +141,25 @@ class AIFeatures:
             logger.error(f"Error in ticket summary generation: {e}")
             return "Error generating summary"
 
+    async def generate_ticket_summaries(self, ticket_messages: List[List[Dict]], concurrency: int = 8) -> List[str]:
+        """Summarize several tickets, overlapping up to `concurrency` OpenAI requests"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def summarize(messages: List[Dict]) -> str:
+            async with semaphore:
+                return await self.generate_ticket_summary(messages)
+
+        # generate_ticket_summary never raises, so one failure can't cancel the batch
+        return await asyncio.gather(*(summarize(messages) for messages in ticket_messages))
+
     async def suggest_macros(self, text: str, macros: List[Dict]) -> List[Dict]:
         """Suggest relevant macros based on ticket content"""
         try:
-            # Extract keywords from the text
-            text_keywords = await self.extract_keywords(text)
-            
-            # Score each macro based on keyword matches
-            scored_macros = []
-            for macro in macros:
-                macro_keywords = await self.extract_keywords(macro["content"])
-                score = len(set(text_keywords) & set(macro_keywords))
-                if score > 0:
-                    scored_macros.append({
-                        "macro": macro,
-                        "score": score
-                    })
-            
-            # Sort by score and return top matches
-            return sorted(scored_macros, key=lambda x: x["score"], reverse=True)[:3]
+            # Score macros by the keywords they share with the text
+            return [
+                {"macro": macros[position], "score": score}
+                for position, score in self._top_matches(text, "macro", macros, "macro_id")
+            ]
         except Exception as e:
             logger.error(f"Error in macro suggestion: {e}")
             return []
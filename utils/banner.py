@@ -1,14 +1,9 @@
 """
 Banner and startup information display utilities.
 """
-import platform
-import psutil
 import sys
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+import time
 import discord
-from datetime import datetime
 from typing import Dict, Any, List
 
 # Define color codes
@@ -24,36 +19,53 @@ COLORS = {
     'reset': '\033[0m'
 }
 
+# Only emit ANSI codes when stdout is a terminal, not a log file or pipe
+_USE_ANSI = sys.stdout is not None and sys.stdout.isatty()
+
+def _c(name: str) -> str:
+    """Get the ANSI code for a color, or an empty string when ANSI is off."""
+    return COLORS[name] if _USE_ANSI else ""
+
+# Frequently used codes bound to names so hot paths skip the dict lookup
+_C_CYAN, _C_GREEN, _C_RED, _C_YELLOW, _C_MAGENTA, _C_RESET, _C_BOLD = (
+    _c(k) for k in ("cyan", "green", "red", "yellow", "magenta", "reset", "bold")
+)
+
 NEXON_BANNER = f"""
-{COLORS['cyan']}{COLORS['bold']}
+{_c('cyan')}{_c('bold')}
     ███╗   ██╗███████╗██╗  ██╗ ██████╗ ███╗   ██╗
     ████╗  ██║██╔════╝╚██╗██╔╝██╔═══██╗████╗  ██║
     ██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║██╔██╗ ██║
     ██║╚██╗██║██╔══╝   ██╔██╗ ██║   ██║██║╚██╗██║
     ██║ ╚████║███████╗██╔╝ ██╗╚██████╔╝██║ ╚████║
     ╚═╝  ╚═══╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═══╝
-{COLORS['end']}
-{COLORS['green']}  🎫 Advanced Discord Ticket & Support System 🤖{COLORS['end']}
+{_c('end')}
+{_c('green')}  🎫 Advanced Discord Ticket & Support System 🤖{_c('end')}
 """
 
 def print_banner(version: str, discord_version: str = discord.__version__) -> None:
     """Print a beautiful Nexon-themed startup banner"""
-    console = Console()
+    # Imported here so importing this module doesn't load rich
+    from rich.console import Console
+    from rich.padding import Padding
+    from rich.panel import Panel
+    from rich.text import Text
     
-    # Create banner text
-    banner_text = Text()
-    banner_text.append(NEXON_BANNER, style="bright_blue")
-    banner_text.append("\n")
+    console = Console()
     
-    # Add version and discord.py version
-    banner_text.append(f"Version: {version}", style="cyan")
-    banner_text.append(" | ", style="dim")
-    banner_text.append(f"Discord.py: {discord.__version__}", style="magenta")
-    banner_text.append("\n")
+    t = time.localtime()
+    current_time = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
     
-    # Current time
-    current_time = datetime.now().strftime("%H:%M:%S")
-    banner_text.append(f"Started at: {current_time}", style="green")
+    # Build the banner, version line and start time in one Text
+    banner_text = Text.assemble(
+        (NEXON_BANNER, "bright_blue"),
+        "\n",
+        (f"Version: {version}", "cyan"),
+        (" | ", "dim"),
+        (f"Discord.py: {discord_version}", "magenta"),
+        "\n",
+        (f"Started at: {current_time}", "green")
+    )
     
     # Create panel
     panel = Panel(
@@ -63,38 +75,69 @@ def print_banner(version: str, discord_version: str = discord.__version__) -> No
         subtitle_align="right"
     )
     
-    # Print with spacing
-    console.print("\n")
-    console.print(panel)
-    console.print("\n")
+    # Print with spacing in a single render
+    console.print(Padding(panel, (2, 0)))
+
+# Minimum seconds between psutil reads in get_system_info
+SYSTEM_INFO_TTL = 1.0
+
+_system_info_cache = {"ts": 0.0, "val": None}
 
 def get_system_info() -> Dict[str, Any]:
-    """Get system information."""
-    return {
-        'python_version': platform.python_version(),
-        'os_name': platform.system(),
-        'os_version': platform.version(),
-        'cpu_usage': psutil.cpu_percent(),
-        'memory_usage': psutil.virtual_memory().percent,
-        'discord_version': discord.__version__,
-        'timestamp': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
-    }
+    """Get system information, re-reading psutil at most once per SYSTEM_INFO_TTL."""
+    now = time.monotonic()
+    if _system_info_cache["val"] is None or now - _system_info_cache["ts"] >= SYSTEM_INFO_TTL:
+        import platform
+        import psutil
+        t = time.gmtime()
+        _system_info_cache["val"] = {
+            'python_version': platform.python_version(),
+            'os_name': platform.system(),
+            'os_version': platform.version(),
+            'cpu_usage': psutil.cpu_percent(),
+            'memory_usage': psutil.virtual_memory().percent,
+            'discord_version': discord.__version__,
+            'timestamp': (
+                f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d} UTC"
+            )
+        }
+        _system_info_cache["ts"] = now
+    # Copy so callers can't modify the cached snapshot
+    return dict(_system_info_cache["val"])
+
+# Display templates with the color codes baked in once at import
+_SYSINFO_TMPL = f"""
+{_c('yellow')}System Information:{_c('end')}
+• Python: v{{python_version}}
+• OS: {{os_name}} {{os_version}}
+• CPU Usage: {{cpu_usage}}%
+• Memory Usage: {{memory_usage}}%
+• Discord.py: v{{discord_version}}
+• Started: {{timestamp}}
+"""
+
+_SECTION_HEADER_TMPL = (
+    f"\n{_c('cyan')}+{{rule}}+\n"
+    f"| {_c('yellow')}{{title}}{_c('cyan')} |\n"
+    f"+{{rule}}+{_c('reset')}\n"
+)
+
+_STAT_LINE_TMPL = f"{_c('cyan')}|{_c('reset')} {{label}}: {{color}}{{value}}{_c('reset')}"
+
+_GUILD_INFO_TMPL = (
+    f"{_c('cyan')}+-{_c('magenta')}{{name}}{_c('reset')}\n"
+    f"{_c('cyan')}|  +-{_c('reset')} Members: {{members}}\n"
+    f"{_c('cyan')}|  +-{_c('reset')} Channels: {{channels}}"
+)
 
 def format_system_info(info: Dict[str, Any]) -> str:
     """Format system information for display."""
-    return f"""
-{COLORS['yellow']}System Information:{COLORS['end']}
-• Python: v{info['python_version']}
-• OS: {info['os_name']} {info['os_version']}
-• CPU Usage: {info['cpu_usage']}%
-• Memory Usage: {info['memory_usage']}%
-• Discord.py: v{info['discord_version']}
-• Started: {info['timestamp']}
-"""
+    return _SYSINFO_TMPL.format_map(info)
 
 def display_banner() -> None:
     """Display the NEXON banner and system information."""
-    print(BANNER)
+    print(NEXON_BANNER)
     print(format_system_info(get_system_info()))
 
 def get_startup_info() -> List[str]:
@@ -107,13 +150,24 @@ def get_startup_info() -> List[str]:
         "🔄 Connecting to Discord..."
     ]
 
+# Bar segments are sliced from these instead of built per call
+_FILL_CHARS = '#' * 256
+_EMPTY_CHARS = '-' * 256
+
 def get_progress_bar(progress: float, width: int = 40) -> str:
     """Create a colorful progress bar."""
+    global _FILL_CHARS, _EMPTY_CHARS
     filled = int(width * progress)
     empty = width - filled
-    bar = f"{COLORS['green']}{'#' * filled}{COLORS['red']}{'-' * empty}{COLORS['reset']}"
-    percentage = f"{int(progress * 100)}%"
-    return f"[{bar}] {percentage}"
+    # Negative counts rendered as empty strings with '*'; keep that when slicing
+    filled, empty = max(filled, 0), max(empty, 0)
+    if max(filled, empty) > len(_FILL_CHARS):
+        _FILL_CHARS = '#' * max(filled, empty)
+        _EMPTY_CHARS = '-' * max(filled, empty)
+    return "".join((
+        "[", _C_GREEN, _FILL_CHARS[:filled], _C_RED, _EMPTY_CHARS[:empty], _C_RESET,
+        "] ", str(int(progress * 100)), "%"
+    ))
 
 def print_startup_sequence() -> None:
     """Print a beautiful startup sequence."""
@@ -126,39 +180,41 @@ def print_startup_sequence() -> None:
     ]
     
     print("\n" * 2)
-    print(BANNER)
-    print(f"\n{COLORS['cyan']}{'-' * 60}{COLORS['reset']}")
+    print(NEXON_BANNER)
+    print(f"\n{_C_CYAN}{'-' * 60}{_C_RESET}")
     
+    # Buffer the progress lines and write them out in one go
+    parts = []
     for i, message in enumerate(messages, 1):
         progress = i / len(messages)
-        sys.stdout.write(f"\r{message} {get_progress_bar(progress)}")
-        sys.stdout.flush()
+        parts.append(f"\r{message} {get_progress_bar(progress)}")
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
     
-    print("\n\n" + f"{COLORS['green']}[+] System initialization complete! [+]{COLORS['reset']}\n")
+    print("\n\n" + f"{_C_GREEN}[+] System initialization complete! [+]{_C_RESET}\n")
+
+_STATUS_UP = f"{_C_GREEN}[+]{_C_RESET}"
+_STATUS_DOWN = f"{_C_RED}[-]{_C_RESET}"
 
 def get_status_indicator(status: bool) -> str:
     """Get a colorful status indicator."""
-    return f"{COLORS['green']}[+]{COLORS['reset']}" if status else f"{COLORS['red']}[-]{COLORS['reset']}"
+    return _STATUS_UP if status else _STATUS_DOWN
 
 def format_section_header(title: str) -> str:
     """Format a section header with decorative elements."""
-    return f"\n{COLORS['cyan']}+{'-' * (len(title) + 4)}+\n| {COLORS['yellow']}{title}{COLORS['cyan']} |\n+{'-' * (len(title) + 4)}+{COLORS['reset']}\n"
+    return _SECTION_HEADER_TMPL.format(rule='-' * (len(title) + 4), title=title)
 
 def format_stat_line(label: str, value: str, color: str = 'reset') -> str:
     """Format a statistics line with proper spacing and color."""
-    return f"{COLORS['cyan']}|{COLORS['reset']} {label}: {COLORS[color]}{value}{COLORS['reset']}"
+    return _STAT_LINE_TMPL.format(label=label, color=_c(color), value=value)
 
 def format_guild_info(name: str, members: int, channels: int) -> str:
     """Format guild information with proper indentation and styling."""
-    return (
-        f"{COLORS['cyan']}+-{COLORS['magenta']}{name}{COLORS['reset']}\n"
-        f"{COLORS['cyan']}|  +-{COLORS['reset']} Members: {members}\n"
-        f"{COLORS['cyan']}|  +-{COLORS['reset']} Channels: {channels}"
-    )
+    return _GUILD_INFO_TMPL.format(name=name, members=members, channels=channels)
 
 def get_time_of_day_greeting() -> str:
     """Get a time-appropriate greeting."""
-    hour = datetime.now().hour
+    hour = time.localtime().tm_hour
     if 5 <= hour < 12:
         return "[Morning]"
     elif 12 <= hour < 17:
@@ -170,6 +226,7 @@ def get_time_of_day_greeting() -> str:
 
 __all__ = [
     'print_banner',
+    'display_banner',
     'get_startup_info',
     'get_system_info',
     'format_system_info',
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # Bot Information
 BOT_NAME = "Nexon"
@@ -24,25 +25,25 @@ APPLICATION_ID = os.getenv("APPLICATION_ID")
 # Ticket System
 MAX_TICKETS_PER_USER = 3
 TICKET_CLOSE_DELAY = 5  # seconds
-TICKET_CATEGORIES = [
+TICKET_CATEGORIES = (
     "General Support",
     "Technical Issues",
     "Billing Support",
     "Account Issues",
     "Other"
-]
+)
 
 # Colors
-COLORS = {
+COLORS = MappingProxyType({
     "PRIMARY": 0x3498db,    # Blue
     "SUCCESS": 0x2ecc71,    # Green
     "ERROR": 0xe74c3c,      # Red
     "WARNING": 0xf1c40f,    # Yellow
     "INFO": 0x95a5a6,       # Gray
-}
+})
 
 # Emojis
-EMOJIS = {
+EMOJIS = MappingProxyType({
     "SUCCESS": "✅",
     "ERROR": "❌",
     "WARNING": "⚠️",
@@ -79,30 +80,46 @@ EMOJIS = {
     "ARROW_RIGHT": "➡️",
     "ARROW_LEFT": "⬅️",
     "ARROW_UP": "⬆️",
-    "ARROW_DOWN": "⬇️"
-}
+    "ARROW_DOWN": "⬇️",
+    "LOADING": "⏳",
+    "ARCHIVE": "📂",
+    "STAFF": "👮",
+    "USER": "👤",
+    "SETTINGS": "⚙️",
+    "HELP": "❓",
+    "BACK": "⬅️",
+    "NEXT": "➡️",
+    "OPEN": "📝",
+    "PENDING": "⏳",
+    "PROGRESS": "🔄",
+    "ESCALATED": "🔥",
+    "RESOLVED": "✅"
+})
+
+# Flat EMOJI_<NAME> aliases for modules that star-import the constants
+globals().update({f"EMOJI_{name}": emoji for name, emoji in EMOJIS.items()})
 
 # Timeouts (in seconds)
-TIMEOUTS = {
+TIMEOUTS = MappingProxyType({
     "BUTTON": 300,        # 5 minutes
     "MODAL": 300,         # 5 minutes
     "SELECT": 300,        # 5 minutes
     "TICKET_INACTIVE": 604800  # 7 days
-}
+})
 
 # Default settings
-DEFAULT_SETTINGS = {
+DEFAULT_SETTINGS = MappingProxyType({
     "THEME_COLOR": COLORS["PRIMARY"],
     "LANGUAGE": "en",
     "TICKET_PREFIX": "ticket-",
-    "MAX_TICKETS_PER_USER": 3,
+    "MAX_TICKETS_PER_USER": MAX_TICKETS_PER_USER,
     "MAX_TICKET_AGE_DAYS": 30,
     "MAINTENANCE_MODE": False,
     "MAINTENANCE_MESSAGE": "The ticket system is currently under maintenance. Please try again later."
-}
+})
 
 # Required Bot Permissions
-BOT_PERMISSIONS = [
+BOT_PERMISSIONS = (
     "manage_channels",
     "manage_roles",
     "manage_messages",
@@ -113,15 +130,16 @@ BOT_PERMISSIONS = [
     "read_message_history",
     "add_reactions",
     "use_external_emojis"
-]
+)
 
-# Create necessary directories
-DATA_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
-TRANSCRIPTS_DIR.mkdir(exist_ok=True)
+def init_dirs():
+    """Create the bot's data, log and transcript directories; called once at startup"""
+    for directory in (DATA_DIR, LOGS_DIR, TRANSCRIPTS_DIR):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
 
 # Ticket statuses
-TICKET_STATUS = {
+TICKET_STATUS = MappingProxyType({
     "OPEN": "open",
     "PENDING_USER": "pending_user",
     "PENDING_STAFF": "pending_staff",
@@ -129,7 +147,7 @@ TICKET_STATUS = {
     "ESCALATED": "escalated",
     "RESOLVED": "resolved",
     "CLOSED": "closed"
-}
+})
 
 # Default colors
 DEFAULT_COLOR = 0x5865F2  # Discord Blurple
@@ -147,16 +165,7 @@ ERROR_EMOJI = "❌"
 WARNING_EMOJI = "⚠️"
 
 # Permissions
-STAFF_PERMISSIONS = [
-    "manage_messages",
-    "read_messages",
-    "send_messages",
-    "embed_links",
-    "attach_files",
-    "read_message_history"
-]
-
-ADMIN_PERMISSIONS = [
+ADMIN_PERMISSIONS = (
     "manage_channels",
     "manage_roles",
     "manage_messages",
@@ -165,7 +174,7 @@ ADMIN_PERMISSIONS = [
     "embed_links",
     "attach_files",
     "read_message_history"
-]
+)
 
 # Cache Settings
 CACHE_TTL = 300  # 5 minutes
@@ -176,17 +185,18 @@ TICKET_NAME_FORMAT = "ticket-{}"
 TRANSCRIPT_RETENTION_DAYS = 30
 
 # File paths
-PATHS = {
+PATHS = MappingProxyType({
     "DATA": "data",
     "LOGS": "logs",
     "TRANSCRIPTS": "data/transcripts",
     "CONFIG": "config"
-}
+})
 
 # Time Constants
 SECONDS_IN_MINUTE = 60
 SECONDS_IN_HOUR = 3600
 SECONDS_IN_DAY = 86400
+SECONDS_IN_WEEK = 604800
 
 # Limits
 MAX_EMBED_DESCRIPTION = 4096
@@ -195,25 +205,6 @@ MAX_EMBED_FIELDS = 25
 MAX_EMBED_TITLE = 256
 MAX_MESSAGE_LENGTH = 2000
 
-# Emoji constants
-EMOJI_SUCCESS = "✅"
-EMOJI_ERROR = "❌"
-EMOJI_WARNING = "⚠️"
-EMOJI_INFO = "ℹ️"
-EMOJI_LOADING = "⏳"
-EMOJI_TICKET = "🎫"
-EMOJI_LOCK = "🔒"
-EMOJI_UNLOCK = "🔓"
-EMOJI_PIN = "📌"
-EMOJI_TRASH = "🗑️"
-EMOJI_ARCHIVE = "📂"
-EMOJI_STAFF = "👮"
-EMOJI_USER = "👤"
-EMOJI_SETTINGS = "⚙️"
-EMOJI_HELP = "❓"
-EMOJI_BACK = "⬅️"
-EMOJI_NEXT = "➡️"
-
 # Color constants
 COLOR_SUCCESS = 0x2ecc71  # Green
 COLOR_ERROR = 0xe74c3c    # Red
@@ -221,25 +212,13 @@ COLOR_WARNING = 0xf1c40f  # Yellow
 COLOR_INFO = 0x3498db     # Blue
 COLOR_DEFAULT = 0x7289da  # Discord Blurple
 
-# Time constants
-SECONDS_IN_MINUTE = 60
-SECONDS_IN_HOUR = 3600
-SECONDS_IN_DAY = 86400
-SECONDS_IN_WEEK = 604800
-
-# Message constants
-MAX_EMBED_DESCRIPTION = 4096
-MAX_EMBED_FIELD_VALUE = 1024
-MAX_EMBED_FIELDS = 25
-
 # Ticket constants
-MAX_TICKETS_PER_USER = 3
 TICKET_CLOSE_TIMEOUT = 72  # Hours
 TICKET_AUTO_ARCHIVE_DAYS = 7
 MAX_TRANSCRIPT_MESSAGES = 5000
 
 # Permission constants
-STAFF_PERMISSIONS = [
+STAFF_PERMISSIONS = (
     "view_channel",
     "send_messages",
     "embed_links",
@@ -249,9 +228,9 @@ STAFF_PERMISSIONS = [
     "use_external_emojis",
     "manage_messages",
     "manage_channels"
-]
+)
 
-USER_PERMISSIONS = [
+USER_PERMISSIONS = (
     "view_channel",
     "send_messages",
     "embed_links",
@@ -259,4 +238,4 @@ USER_PERMISSIONS = [
     "read_message_history",
     "add_reactions",
     "use_external_emojis"
-]
\ No newline at end of file
+)
\ No newline at end of file
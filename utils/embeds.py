@@ -2,23 +2,29 @@
 Embed templates for the ticket system.
 """
 import discord
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Union
+from datetime import datetime, timezone
 from .constants import *
 
+# Shared Color objects so embeds don't build a new one per call
+_COLOR_DEFAULT, _COLOR_ERROR, _COLOR_SUCCESS, _COLOR_INFO, _COLOR_WARNING = (
+    discord.Color(c) for c in (DEFAULT_COLOR, ERROR_COLOR, SUCCESS_COLOR, COLOR_INFO, WARNING_COLOR)
+)
+
 def create_base_embed(
     title: str,
     description: str,
-    color: Optional[int] = None,
+    color: Optional[Union[int, discord.Color]] = None,
     footer_text: Optional[str] = None,
-    thumbnail_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None,
+    timestamp: bool = True
 ) -> discord.Embed:
     """Create a base embed with consistent styling."""
     embed = discord.Embed(
         title=title,
         description=description,
-        color=color or COLORS.DEFAULT,
-        timestamp=datetime.utcnow()
+        color=color or _COLOR_DEFAULT,
+        timestamp=datetime.now(timezone.utc) if timestamp else None
     )
     
     if footer_text:
@@ -38,7 +44,7 @@ def create_error_embed(
     return create_base_embed(
         title=f"{EMOJI_ERROR} {title}",
         description=description,
-        color=COLORS.ERROR,
+        color=_COLOR_ERROR,
         footer_text=footer_text
     )
 
@@ -51,7 +57,7 @@ def create_success_embed(
     return create_base_embed(
         title=f"{EMOJI_SUCCESS} {title}",
         description=description,
-        color=COLORS.SUCCESS,
+        color=_COLOR_SUCCESS,
         footer_text=footer_text
     )
 
@@ -64,7 +70,7 @@ def create_info_embed(
     return create_base_embed(
         title=f"{EMOJI_INFO} {title}",
         description=description,
-        color=COLORS.INFO,
+        color=_COLOR_INFO,
         footer_text=footer_text
     )
 
@@ -74,20 +80,21 @@ def create_support_panel_embed(
     theme_color: Optional[int] = None
 ) -> discord.Embed:
     """Create the support panel embed."""
-    description = (
+    parts = [
         f"Welcome to {guild_name}'s Support System!\n\n"
         "To create a ticket, click one of the buttons below corresponding to your issue category.\n"
         "Our support team will assist you as soon as possible.\n\n"
         "__Available Categories:__\n"
+    ]
+    parts.extend(
+        f"\n{category['emoji']} **{category['name']}**\n{category['description']}"
+        for category in categories
     )
     
-    for category in categories:
-        description += f"\n{category['emoji']} **{category['name']}**\n{category['description']}"
-    
     return create_base_embed(
         title=f"{EMOJI_SUPPORT} Support Panel",
-        description=description,
-        color=theme_color or COLORS.DEFAULT
+        description="".join(parts),
+        color=theme_color or _COLOR_DEFAULT
     )
 
 def create_ticket_embed(
@@ -99,16 +106,17 @@ def create_ticket_embed(
     theme_color: Optional[int] = None
 ) -> discord.Embed:
     """Create the initial ticket embed."""
+    creator_repr = "Anonymous" if is_anonymous else creator.mention
     embed = create_base_embed(
         title=f"{EMOJI_TICKET} Ticket #{ticket_id}",
         description=(
             f"**Category:** {category}\n"
-            f"**Created by:** {'Anonymous' if is_anonymous else creator.mention}\n"
+            f"**Created by:** {creator_repr}\n"
             f"**Status:** {EMOJI_OPEN} Open\n\n"
             "__Initial Message:__\n"
             f"{initial_message}"
         ),
-        color=theme_color or COLORS.DEFAULT
+        color=theme_color or _COLOR_DEFAULT
     )
     
     if not is_anonymous:
@@ -135,7 +143,7 @@ def create_ticket_closed_embed(
     return create_base_embed(
         title=f"{EMOJI_LOCK} Ticket #{ticket_id} Closed",
         description=description,
-        color=COLORS.WARNING
+        color=_COLOR_WARNING
     )
 
 def create_ticket_claimed_embed(
@@ -146,24 +154,26 @@ def create_ticket_claimed_embed(
     return create_base_embed(
         title=f"{EMOJI_STAFF} Ticket #{ticket_id} Claimed",
         description=f"This ticket has been claimed by {staff_member.mention}.",
-        color=COLORS.INFO
+        color=_COLOR_INFO
     )
 
+_STATUS_EMOJI = {
+    "OPEN": EMOJI_OPEN,
+    "PENDING_USER": EMOJI_PENDING,
+    "PENDING_STAFF": EMOJI_PENDING,
+    "IN_PROGRESS": EMOJI_PROGRESS,
+    "ESCALATED": EMOJI_ESCALATED,
+    "RESOLVED": EMOJI_RESOLVED,
+    "CLOSED": EMOJI_LOCK
+}
+
 def create_ticket_status_embed(
     ticket_id: str,
     status: str,
     updated_by: discord.Member
 ) -> discord.Embed:
     """Create the ticket status update embed."""
-    emoji = {
-        "OPEN": EMOJI_OPEN,
-        "PENDING_USER": EMOJI_PENDING,
-        "PENDING_STAFF": EMOJI_PENDING,
-        "IN_PROGRESS": EMOJI_PROGRESS,
-        "ESCALATED": EMOJI_ESCALATED,
-        "RESOLVED": EMOJI_RESOLVED,
-        "CLOSED": EMOJI_LOCK
-    }.get(status, EMOJI_INFO)
+    emoji = _STATUS_EMOJI.get(status, EMOJI_INFO)
     
     return create_base_embed(
         title=f"{emoji} Ticket Status Updated",
@@ -172,7 +182,7 @@ def create_ticket_status_embed(
             f"**New Status:** {status}\n"
             f"**Updated by:** {updated_by.mention}"
         ),
-        color=COLORS.INFO
+        color=_COLOR_INFO
     )
 
 def create_internal_note_embed(
@@ -187,7 +197,7 @@ def create_internal_note_embed(
             f"**Staff Member:** {staff_member.mention}\n"
             f"**Note:**\n{note}"
         ),
-        color=COLORS.STAFF,
+        color=_COLOR_DEFAULT,
         footer_text=f"Ticket #{ticket_id}"
     )
 
@@ -203,7 +213,7 @@ def create_feedback_request_embed(
             "Please rate your support experience by clicking one of the star ratings below.\n"
             "Your feedback helps us improve our support quality."
         ),
-        color=COLORS.DEFAULT,
+        color=_COLOR_DEFAULT,
         footer_text=f"Ticket #{ticket_id}"
     )
 
@@ -220,7 +230,7 @@ def create_feedback_received_embed(
     return create_base_embed(
         title=f"{EMOJI_FEEDBACK} Feedback Received",
         description=description,
-        color=COLORS.SUCCESS,
+        color=_COLOR_SUCCESS,
         footer_text=f"Ticket #{ticket_id}"
     )
 
@@ -233,7 +243,7 @@ def create_stats_embed(
     embed = create_base_embed(
         title=f"{EMOJI_STATS} {title}",
         description="",
-        color=COLORS.INFO,
+        color=_COLOR_INFO,
         footer_text=footer_text
     )
     
@@ -249,19 +259,18 @@ def create_help_embed(
     total_pages: int
 ) -> discord.Embed:
     """Create a help embed."""
-    description = "Here are the available commands:\n\n"
-    
-    for cmd in commands:
-        description += (
-            f"**/{cmd['name']}**\n"
-            f"{cmd['description']}\n"
-            f"Usage: `{cmd['usage']}`\n\n"
-        )
+    parts = ["Here are the available commands:\n\n"]
+    parts.extend(
+        f"**/{cmd['name']}**\n"
+        f"{cmd['description']}\n"
+        f"Usage: `{cmd['usage']}`\n\n"
+        for cmd in commands
+    )
     
     return create_base_embed(
         title=f"{EMOJI_HELP} {title}",
-        description=description,
-        color=COLORS.INFO,
+        description="".join(parts),
+        color=_COLOR_INFO,
         footer_text=f"Page {page}/{total_pages}"
     )
 
@@ -273,7 +282,7 @@ def create_maintenance_embed(message: str) -> discord.Embed:
             "The ticket system is currently under maintenance.\n\n"
             f"**Message from staff:**\n{message}"
         ),
-        color=COLORS.WARNING
+        color=_COLOR_WARNING
     )
 
 def create_sla_alert_embed(
@@ -289,5 +298,5 @@ def create_sla_alert_embed(
             f"**Alert Type:** {sla_type} SLA Exceeded\n"
             f"**Time Elapsed:** {time_elapsed}"
         ),
-        color=COLORS.ERROR
+        color=_COLOR_ERROR
     )
\ No newline at end of file
@@ -2,6 +2,7 @@
 Enums used throughout the bot.
 """
 from enum import Enum, auto
+from typing import Optional
 
 class TicketStatus(str, Enum):
     """Enum for ticket statuses"""
@@ -13,6 +14,12 @@ class TicketStatus(str, Enum):
     ARCHIVED = "archived"
     DELETED = "deleted"
 
+    @classmethod
+    def from_str(cls, status_str: str) -> "TicketStatus":
+        """Convert a string to a TicketStatus enum value"""
+        # _value2member_map_ is the enum's own value index; skips cls()'s ValueError on a miss
+        return cls._value2member_map_.get(status_str, cls.OPEN)  # Default to OPEN if invalid status
+
 class StaffRole(str, Enum):
     """Enum for staff roles"""
     ADMIN = "admin"
@@ -20,6 +27,11 @@ class StaffRole(str, Enum):
     STAFF = "staff"
     TRAINEE = "trainee"
 
+    @classmethod
+    def from_str(cls, role_str: str) -> Optional["StaffRole"]:
+        """Convert a string to a StaffRole enum value, or None if unknown"""
+        return cls._value2member_map_.get(role_str)
+
 class TicketType(str, Enum):
     """Enum for ticket types"""
     SUPPORT = "support"
@@ -28,6 +40,11 @@ class TicketType(str, Enum):
     INQUIRY = "inquiry"
     OTHER = "other"
 
+    @classmethod
+    def from_str(cls, type_str: str) -> "TicketType":
+        """Convert a string to a TicketType enum value"""
+        return cls._value2member_map_.get(type_str, cls.OTHER)
+
 class TicketPriority(str, Enum):
     """Enum for ticket priorities"""
     LOW = "low"
@@ -35,6 +52,11 @@ class TicketPriority(str, Enum):
     HIGH = "high"
     URGENT = "urgent"
 
+    @classmethod
+    def from_str(cls, priority_str: str) -> "TicketPriority":
+        """Convert a string to a TicketPriority enum value"""
+        return cls._value2member_map_.get(priority_str, cls.MEDIUM)
+
 class TicketAction(str, Enum):
     """Enum for ticket actions"""
     CREATE = "create"
@@ -55,9 +77,6 @@ class TicketAction(str, Enum):
         return self.value
 
     @classmethod
-    def from_str(cls, status_str: str):
-        """Convert a string to a TicketStatus enum value"""
-        try:
-            return cls(status_str)
-        except ValueError:
-            return cls.OPEN  # Default to OPEN if invalid status 
\ No newline at end of file
+    def from_str(cls, action_str: str) -> Optional["TicketAction"]:
+        """Convert a string to a TicketAction enum value, or None if unknown"""
+        return cls._value2member_map_.get(action_str)
\ No newline at end of file
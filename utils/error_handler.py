@@ -1,7 +1,6 @@
 """Error handling utilities for the bot."""
 
 import logging
-import traceback
 from typing import Optional, Union
 import discord
 from discord import app_commands
@@ -10,31 +9,66 @@ from .constants import DEFAULT_COLOR
 
 logger = logging.getLogger(__name__)
 
+# Errors users trigger routinely; nothing to report or log
+_IGNORED_ERRORS = (commands.CommandNotFound, app_commands.CommandNotFound)
+
+async def _send_missing_perms(ctx: commands.Context, error: commands.MissingPermissions):
+    await ctx.send("You don't have permission to use this command.", ephemeral=True)
+
+async def _send_missing_arg(ctx: commands.Context, error: commands.MissingRequiredArgument):
+    await ctx.send(f"Missing required argument: {error.param.name}", ephemeral=True)
+
+async def _send_bad_arg(ctx: commands.Context, error: commands.BadArgument):
+    await ctx.send("Invalid argument provided.", ephemeral=True)
+
+async def _send_app_missing_perms(interaction: discord.Interaction, error: app_commands.MissingPermissions):
+    await interaction.response.send_message(
+        "You don't have permission to use this command.",
+        ephemeral=True
+    )
+
+async def _send_app_cooldown(interaction: discord.Interaction, error: app_commands.CommandOnCooldown):
+    await interaction.response.send_message(
+        f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
+        ephemeral=True
+    )
+
+def _find_handler(handlers: dict, error: Exception):
+    """Look up the handler for an error's exact type, then for its base classes"""
+    handler = handlers.get(type(error))
+    if handler is None:
+        # Subclasses (e.g. MemberNotFound -> BadArgument) resolve to the nearest registered base
+        handler = next((handlers[base] for base in type(error).__mro__ if base in handlers), None)
+    return handler
+
 class ErrorHandler(commands.Cog):
+    _HANDLERS = {
+        commands.MissingPermissions: _send_missing_perms,
+        commands.MissingRequiredArgument: _send_missing_arg,
+        commands.BadArgument: _send_bad_arg
+    }
+
+    _APP_HANDLERS = {
+        app_commands.MissingPermissions: _send_app_missing_perms,
+        app_commands.CommandOnCooldown: _send_app_cooldown
+    }
+
     def __init__(self, bot):
         self.bot = bot
 
     @commands.Cog.listener()
     async def on_command_error(self, ctx: commands.Context, error: commands.CommandError):
         """Handle command errors."""
-        if isinstance(error, commands.CommandNotFound):
+        if isinstance(error, _IGNORED_ERRORS):
             return
         
-        if isinstance(error, commands.MissingPermissions):
-            await ctx.send("You don't have permission to use this command.", ephemeral=True)
-            return
-        
-        if isinstance(error, commands.MissingRequiredArgument):
-            await ctx.send(f"Missing required argument: {error.param.name}", ephemeral=True)
-            return
-        
-        if isinstance(error, commands.BadArgument):
-            await ctx.send("Invalid argument provided.", ephemeral=True)
+        handler = _find_handler(self._HANDLERS, error)
+        if handler is not None:
+            await handler(ctx, error)
             return
         
         # Log the error
-        logger.error(f"Command error: {str(error)}")
-        logger.error(traceback.format_exc())
+        logger.error("Command error: %s", error, exc_info=error)
         
         # Send error message
         await ctx.send("An error occurred while processing your command.", ephemeral=True)
@@ -46,23 +80,16 @@ class ErrorHandler(commands.Cog):
         error: app_commands.AppCommandError
     ):
         """Handle application command errors."""
-        if isinstance(error, app_commands.MissingPermissions):
-            await interaction.response.send_message(
-                "You don't have permission to use this command.",
-                ephemeral=True
-            )
+        if isinstance(error, _IGNORED_ERRORS):
             return
         
-        if isinstance(error, app_commands.CommandOnCooldown):
-            await interaction.response.send_message(
-                f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
-                ephemeral=True
-            )
+        handler = _find_handler(self._APP_HANDLERS, error)
+        if handler is not None:
+            await handler(interaction, error)
             return
         
         # Log the error
-        logger.error(f"Application command error: {str(error)}")
-        logger.error(traceback.format_exc())
+        logger.error("Application command error: %s", error, exc_info=error)
         
         # Send error message
         if interaction.response.is_done():
@@ -96,8 +123,7 @@ def handle_error(
     error_message = str(error)
     
     # Log the error
-    logger.error(f"Error: {error_type} - {error_message}")
-    logger.error(traceback.format_exc())
+    logger.error("Error: %s - %s", error_type, error_message, exc_info=error)
     
     # Create error embed
     embed = discord.Embed(
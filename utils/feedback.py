@@ -1,11 +1,12 @@
 """
 Feedback system utilities for handling ticket feedback and analytics.
 """
+import re
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter
 from database.models import TicketFeedback, Ticket, Guild
-from sqlalchemy import func
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 async def store_feedback(
@@ -28,6 +29,7 @@ async def store_feedback(
     """
     feedback = TicketFeedback(
         ticket_db_id=ticket.ticket_db_id,
+        guild_id=ticket.guild_id,
         user_id=ticket.creator_id,
         rating=rating,
         comments=comments
@@ -37,6 +39,52 @@ async def store_feedback(
     await session.commit()
     return feedback
 
+async def _rating_distribution(session: AsyncSession, criteria: List[Any]) -> Counter:
+    """Count feedback per rating in the database for tickets matching criteria"""
+    result = await session.execute(
+        select(TicketFeedback.rating, func.count())
+        .join(Ticket)
+        .where(*criteria)
+        .group_by(TicketFeedback.rating)
+    )
+    return Counter(dict(result.all()))
+
+def _has_comment():
+    """Filter for feedback that carries a non-empty comment"""
+    return TicketFeedback.comments.isnot(None) & (TicketFeedback.comments != '')
+
+async def _recent_commented_feedback(
+    session: AsyncSession,
+    criteria: List[Any],
+    limit: int = 5
+) -> List[Row]:
+    """Fetch the most recent feedback with comments for tickets matching criteria"""
+    # Plain column rows; the stats only read these fields, so skip ORM hydration
+    result = await session.execute(
+        select(
+            TicketFeedback.rating,
+            TicketFeedback.comments,
+            TicketFeedback.submitted_at,
+            TicketFeedback.ticket_db_id
+        )
+        .join(Ticket)
+        .where(*criteria, _has_comment())
+        .order_by(TicketFeedback.submitted_at.desc())
+        .limit(limit)
+    )
+    return result.all()
+
+async def _closed_ticket_count(
+    session: AsyncSession,
+    criteria: List[Any],
+    cutoff: Optional[datetime] = None
+) -> int:
+    """Count closed tickets matching criteria, optionally closed since cutoff"""
+    stmt = select(func.count(Ticket.ticket_db_id)).where(*criteria, Ticket.closed_at.is_not(None))
+    if cutoff is not None:
+        stmt = stmt.where(Ticket.closed_at >= cutoff)
+    return (await session.execute(stmt)).scalar_one()
+
 async def get_feedback_stats(
     session: AsyncSession,
     guild_id: str,
@@ -53,16 +101,17 @@ async def get_feedback_stats(
     Returns:
         Dictionary containing feedback statistics
     """
-    query = session.query(TicketFeedback).join(Ticket)
+    criteria = [Ticket.guild_id == guild_id]
+    ticket_criteria = list(criteria)
+    cutoff = None
     
     if days:
         cutoff = datetime.utcnow() - timedelta(days=days)
-        query = query.filter(TicketFeedback.submitted_at >= cutoff)
+        criteria.append(TicketFeedback.submitted_at >= cutoff)
     
-    query = query.filter(Ticket.guild_id == guild_id)
-    feedbacks = await query.all()
+    rating_dist = await _rating_distribution(session, criteria)
     
-    if not feedbacks:
+    if not rating_dist:
         return {
             'total_feedback': 0,
             'average_rating': 0.0,
@@ -71,20 +120,12 @@ async def get_feedback_stats(
             'recent_comments': []
         }
     
-    # Calculate statistics
-    total = len(feedbacks)
-    rating_sum = sum(f.rating for f in feedbacks)
-    rating_dist = defaultdict(int)
-    for f in feedbacks:
-        rating_dist[f.rating] += 1
+    # Calculate statistics from the per-rating counts
+    total = sum(rating_dist.values())
+    rating_sum = sum(rating * count for rating, count in rating_dist.items())
     
     # Get total tickets in period for feedback rate
-    total_tickets = await session.query(func.count(Ticket.ticket_db_id))\
-        .filter(Ticket.guild_id == guild_id)\
-        .filter(Ticket.closed_at.isnot(None))
-    if days:
-        total_tickets = total_tickets.filter(Ticket.closed_at >= cutoff)
-    total_tickets = await total_tickets.scalar()
+    total_tickets = await _closed_ticket_count(session, ticket_criteria, cutoff)
     
     # Get recent comments
     recent_comments = [
@@ -93,17 +134,13 @@ async def get_feedback_stats(
             'comment': f.comments,
             'submitted_at': f.submitted_at
         }
-        for f in sorted(
-            [f for f in feedbacks if f.comments],
-            key=lambda x: x.submitted_at,
-            reverse=True
-        )[:5]
+        for f in await _recent_commented_feedback(session, criteria)
     ]
     
     return {
         'total_feedback': total,
         'average_rating': rating_sum / total,
-        'rating_distribution': dict(rating_dist),
+        'rating_distribution': {i: rating_dist[i] for i in range(1, 6)},
         'feedback_rate': (total / total_tickets * 100) if total_tickets else 0,
         'recent_comments': recent_comments
     }
@@ -126,20 +163,20 @@ async def get_staff_feedback_stats(
     Returns:
         Dictionary containing staff feedback statistics
     """
-    query = session.query(TicketFeedback).join(Ticket)
+    criteria = [
+        Ticket.guild_id == guild_id,
+        Ticket.claimed_by_id == staff_id
+    ]
+    ticket_criteria = list(criteria)
+    cutoff = None
     
     if days:
         cutoff = datetime.utcnow() - timedelta(days=days)
-        query = query.filter(TicketFeedback.submitted_at >= cutoff)
+        criteria.append(TicketFeedback.submitted_at >= cutoff)
     
-    query = query.filter(
-        Ticket.guild_id == guild_id,
-        Ticket.claimed_by_id == staff_id
-    )
+    rating_dist = await _rating_distribution(session, criteria)
     
-    feedbacks = await query.all()
-    
-    if not feedbacks:
+    if not rating_dist:
         return {
             'total_feedback': 0,
             'average_rating': 0.0,
@@ -148,23 +185,12 @@ async def get_staff_feedback_stats(
             'recent_comments': []
         }
     
-    # Calculate statistics
-    total = len(feedbacks)
-    rating_sum = sum(f.rating for f in feedbacks)
-    rating_dist = defaultdict(int)
-    for f in feedbacks:
-        rating_dist[f.rating] += 1
+    # Calculate statistics from the per-rating counts
+    total = sum(rating_dist.values())
+    rating_sum = sum(rating * count for rating, count in rating_dist.items())
     
     # Get total tickets handled by staff member
-    total_tickets = await session.query(func.count(Ticket.ticket_db_id))\
-        .filter(
-            Ticket.guild_id == guild_id,
-            Ticket.claimed_by_id == staff_id,
-            Ticket.closed_at.isnot(None)
-        )
-    if days:
-        total_tickets = total_tickets.filter(Ticket.closed_at >= cutoff)
-    total_tickets = await total_tickets.scalar()
+    total_tickets = await _closed_ticket_count(session, ticket_criteria, cutoff)
     
     # Get recent comments
     recent_comments = [
@@ -174,17 +200,13 @@ async def get_staff_feedback_stats(
             'submitted_at': f.submitted_at,
             'ticket_id': f.ticket_db_id
         }
-        for f in sorted(
-            [f for f in feedbacks if f.comments],
-            key=lambda x: x.submitted_at,
-            reverse=True
-        )[:5]
+        for f in await _recent_commented_feedback(session, criteria)
     ]
     
     return {
         'total_feedback': total,
         'average_rating': rating_sum / total,
-        'rating_distribution': dict(rating_dist),
+        'rating_distribution': {i: rating_dist[i] for i in range(1, 6)},
         'feedback_rate': (total / total_tickets * 100) if total_tickets else 0,
         'recent_comments': recent_comments
     }
@@ -207,20 +229,20 @@ async def get_category_feedback_stats(
     Returns:
         Dictionary containing category feedback statistics
     """
-    query = session.query(TicketFeedback).join(Ticket)
+    criteria = [
+        Ticket.guild_id == guild_id,
+        Ticket.category_db_id == category_id
+    ]
+    ticket_criteria = list(criteria)
+    cutoff = None
     
     if days:
         cutoff = datetime.utcnow() - timedelta(days=days)
-        query = query.filter(TicketFeedback.submitted_at >= cutoff)
+        criteria.append(TicketFeedback.submitted_at >= cutoff)
     
-    query = query.filter(
-        Ticket.guild_id == guild_id,
-        Ticket.category_db_id == category_id
-    )
+    rating_dist = await _rating_distribution(session, criteria)
     
-    feedbacks = await query.all()
-    
-    if not feedbacks:
+    if not rating_dist:
         return {
             'total_feedback': 0,
             'average_rating': 0.0,
@@ -229,36 +251,54 @@ async def get_category_feedback_stats(
             'common_issues': []
         }
     
-    # Calculate statistics
-    total = len(feedbacks)
-    rating_sum = sum(f.rating for f in feedbacks)
-    rating_dist = defaultdict(int)
-    for f in feedbacks:
-        rating_dist[f.rating] += 1
+    # Calculate statistics from the per-rating counts
+    total = sum(rating_dist.values())
+    rating_sum = sum(rating * count for rating, count in rating_dist.items())
     
     # Get total tickets in category
-    total_tickets = await session.query(func.count(Ticket.ticket_db_id))\
-        .filter(
-            Ticket.guild_id == guild_id,
-            Ticket.category_db_id == category_id,
-            Ticket.closed_at.isnot(None)
-        )
-    if days:
-        total_tickets = total_tickets.filter(Ticket.closed_at >= cutoff)
-    total_tickets = await total_tickets.scalar()
+    total_tickets = await _closed_ticket_count(session, ticket_criteria, cutoff)
     
     # Analyze common issues from comments
-    comments = [f.comments for f in feedbacks if f.comments]
+    result = await session.execute(
+        select(TicketFeedback.comments).join(Ticket).where(*criteria, _has_comment())
+    )
+    comments = result.scalars().all()
     common_issues = analyze_common_issues(comments)
     
     return {
         'total_feedback': total,
         'average_rating': rating_sum / total,
-        'rating_distribution': dict(rating_dist),
+        'rating_distribution': {i: rating_dist[i] for i in range(1, 6)},
         'feedback_rate': (total / total_tickets * 100) if total_tickets else 0,
         'common_issues': common_issues
     }
 
+# Simple keyword-based analysis
+ISSUE_KEYWORDS = {
+    'slow': 'Response Time',
+    'wait': 'Response Time',
+    'delayed': 'Response Time',
+    'unclear': 'Communication',
+    'confusing': 'Communication',
+    'rude': 'Staff Behavior',
+    'unhelpful': 'Staff Behavior',
+    'resolved': 'Resolution',
+    'solved': 'Resolution',
+    'fixed': 'Resolution',
+    'not working': 'Technical Issues',
+    'error': 'Technical Issues',
+    'bug': 'Technical Issues'
+}
+
+# All keywords in one pattern, so each comment is scanned once. The
+# lookahead tries every position, so overlapping keywords such as
+# 'resolved' and 'solved' are both found; no keyword is a prefix of another.
+_ISSUE_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in sorted(ISSUE_KEYWORDS, key=len, reverse=True)) + '))'
+)
+
+_ISSUE_KEYWORD_ITEMS = tuple(ISSUE_KEYWORDS.items())
+
 def analyze_common_issues(comments: List[str]) -> List[Dict[str, Any]]:
     """
     Analyze feedback comments to identify common issues.
@@ -269,34 +309,20 @@ def analyze_common_issues(comments: List[str]) -> List[Dict[str, Any]]:
     Returns:
         List of common issues with their frequency
     """
-    # Simple keyword-based analysis
-    issue_keywords = {
-        'slow': 'Response Time',
-        'wait': 'Response Time',
-        'delayed': 'Response Time',
-        'unclear': 'Communication',
-        'confusing': 'Communication',
-        'rude': 'Staff Behavior',
-        'unhelpful': 'Staff Behavior',
-        'resolved': 'Resolution',
-        'solved': 'Resolution',
-        'fixed': 'Resolution',
-        'not working': 'Technical Issues',
-        'error': 'Technical Issues',
-        'bug': 'Technical Issues'
-    }
-    
-    issue_counts = defaultdict(int)
-    
+    issue_counts = Counter()
     for comment in comments:
-        comment = comment.lower()
-        for keyword, category in issue_keywords.items():
-            if keyword in comment:
+        found = set(_ISSUE_KEYWORD_RE.findall(comment.lower()))
+        if not found:
+            continue
+        # Count each category once per comment, in table order
+        seen = set()
+        for keyword, category in _ISSUE_KEYWORD_ITEMS:
+            if category not in seen and keyword in found:
+                seen.add(category)
                 issue_counts[category] += 1
     
-    # Convert to list and sort by frequency
-    issues = [
+    # most_common() is already sorted by frequency
+    return [
         {'category': category, 'count': count}
-        for category, count in issue_counts.items()
-    ]
-    return sorted(issues, key=lambda x: x['count'], reverse=True)
\ No newline at end of file
+        for category, count in issue_counts.most_common()
+    ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Localization utilities for the bot."""
 
 import json
+import sys
 from pathlib import Path
 from typing import Dict, Any
 
@@ -10,8 +11,26 @@ DEFAULT_LANGUAGE = "en"
 # Load translations
 TRANSLATIONS: Dict[str, Dict[str, Any]] = {}
 
+# Per-language {"ticket.created": "..."} lookup tables built from TRANSLATIONS
+FLAT_TRANSLATIONS: Dict[str, Dict[str, str]] = {}
+
+# Fallback table for languages without a translation file
+_DEFAULT_FLAT: Dict[str, str] = {}
+
+def _flatten(node: Dict[str, Any], prefix: str, out: Dict[str, str]) -> Dict[str, str]:
+    """Collect the string leaves of a nested translation dict under dotted keys."""
+    for name, value in node.items():
+        # Interned so lookups with literal keys usually match by identity
+        key = sys.intern(f"{prefix}{name}")
+        if isinstance(value, dict):
+            _flatten(value, f"{key}.", out)
+        elif isinstance(value, str):
+            out[key] = value
+    return out
+
 def load_translations():
     """Load all translation files from the translations directory."""
+    global _DEFAULT_FLAT
     translations_dir = Path("translations")
     if not translations_dir.exists():
         translations_dir.mkdir(parents=True)
@@ -23,8 +42,11 @@ def load_translations():
             with open(file, "r", encoding="utf-8") as f:
                 lang = file.stem
                 TRANSLATIONS[lang] = json.load(f)
+                FLAT_TRANSLATIONS[lang] = _flatten(TRANSLATIONS[lang], "", {})
         except Exception as e:
             print(f"Error loading translation file {file}: {e}")
+    
+    _DEFAULT_FLAT = FLAT_TRANSLATIONS.get(DEFAULT_LANGUAGE, {})
 
 def create_default_translation():
     """Create the default English translation file."""
@@ -66,30 +88,20 @@ def get_text(key: str, language: str = DEFAULT_LANGUAGE, **kwargs) -> str:
     Returns:
         The translated text, or the key if translation not found
     """
-    if not TRANSLATIONS:
-        load_translations()
-    
     # Get translation for the specified language, fall back to English
-    translation = TRANSLATIONS.get(language, TRANSLATIONS.get(DEFAULT_LANGUAGE, {}))
-    
-    # Split the key into parts and traverse the translation dict
-    parts = key.split(".")
-    current = translation
+    translation = FLAT_TRANSLATIONS.get(language, _DEFAULT_FLAT)
     
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part, key)
-        else:
-            return key
-    
-    # If we found a string, format it with any provided kwargs
-    if isinstance(current, str):
-        try:
-            return current.format(**kwargs)
-        except KeyError:
-            return current
+    text = translation.get(key)
+    if text is None:
+        return key
     
-    return key
+    # Format with any provided kwargs; plain strings are returned as-is
+    if not kwargs:
+        return text
+    try:
+        return text.format(**kwargs)
+    except KeyError:
+        return text
 
 # Initialize translations
 load_translations()
\ No newline at end of file
@@ -3,7 +3,8 @@ import sys
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from rich.logging import RichHandler
 from rich.console import Console
 from rich.theme import Theme
@@ -20,6 +21,47 @@ NEXON_THEME = Theme({
 
 console = Console(theme=NEXON_THEME)
 
+@lru_cache(maxsize=1)
+def _shared_handlers() -> Tuple[logging.Handler, logging.Handler]:
+    """
+    Create the console and file handlers once. Every logger from get_logger
+    shares them, so the log file is opened by a single handler and lock.
+    """
+    # Create logs directory
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+
+    # Create console handler with Rich
+    console_handler = RichHandler(
+        rich_tracebacks=True,
+        console=console,
+        show_time=True,
+        show_path=False
+    )
+    console_handler.setLevel(logging.INFO)
+
+    # Create file handler
+    log_file = log_dir / f"nexon-{datetime.now().strftime('%Y-%m-%d')}.log"
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=10 * 1024 * 1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
+    )
+    file_handler.setLevel(logging.DEBUG)
+
+    # Create formatter
+    formatter = logging.Formatter(
+        '[%(asctime)s] %(levelname)-8s %(message)s',
+        datefmt='%H:%M:%S'
+    )
+
+    # Set formatters
+    console_handler.setFormatter(formatter)
+    file_handler.setFormatter(formatter)
+
+    return console_handler, file_handler
+
 def get_logger(name: str = "nexon", level: Optional[int] = None) -> logging.Logger:
     """Get or create a logger instance"""
     logger = logging.getLogger(name)
@@ -29,42 +71,9 @@ def get_logger(name: str = "nexon", level: Optional[int] = None) -> logging.Logg
         level = level or logging.INFO
         logger.setLevel(level)
 
-        # Create logs directory
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-
-        # Create console handler with Rich
-        console_handler = RichHandler(
-            rich_tracebacks=True,
-            console=console,
-            show_time=True,
-            show_path=False
-        )
-        console_handler.setLevel(logging.INFO)
-
-        # Create file handler
-        log_file = log_dir / f"nexon-{datetime.now().strftime('%Y-%m-%d')}.log"
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(logging.DEBUG)
-
-        # Create formatter
-        formatter = logging.Formatter(
-            '[%(asctime)s] %(levelname)-8s %(message)s',
-            datefmt='%H:%M:%S'
-        )
-
-        # Set formatters
-        console_handler.setFormatter(formatter)
-        file_handler.setFormatter(formatter)
-
         # Add handlers
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        for handler in _shared_handlers():
+            logger.addHandler(handler)
 
     return logger
 
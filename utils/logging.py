@@ -1,4 +1,5 @@
 import os
+import functools
 import logging
 import logging.handlers
 from datetime import datetime
@@ -27,6 +28,23 @@ custom_theme = Theme({
 # Initialize rich console
 console = Console(theme=custom_theme)
 
+# Shared by every log file handler; formatters hold no per-handler state
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def _rotating_file_handler(filename: str) -> logging.handlers.RotatingFileHandler:
+    """Create a 5MB x 5 rotating handler for a file in LOGS_DIR"""
+    handler = logging.handlers.RotatingFileHandler(
+        filename=LOGS_DIR / filename,
+        maxBytes=5_242_880,  # 5MB
+        backupCount=5,
+        encoding="utf-8"
+    )
+    handler.setFormatter(_FILE_FORMATTER)
+    return handler
+
 class CustomFormatter(logging.Formatter):
     """Custom formatter with colors and emojis"""
     
@@ -38,9 +56,19 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: "💥 {message}",
     }
 
+    def __init__(self):
+        super().__init__()
+        # One formatter per level, built once instead of per record
+        self._fmts = {
+            level: logging.Formatter(fmt, style="{")
+            for level, fmt in self.FORMATS.items()
+        }
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, style="{")
+        formatter = self._fmts.get(record.levelno)
+        if formatter is None:
+            # Levels without a format (e.g. custom levels) get the plain message
+            return super().format(record)
         return formatter.format(record)
 
 def setup_logging():
@@ -68,57 +96,13 @@ def setup_logging():
     logger.addHandler(console_handler)
 
     # File handler for all logs
-    file_handler = logging.handlers.RotatingFileHandler(
-        filename=LOGS_DIR / "nexon.log",
-        maxBytes=5_242_880,  # 5MB
-        backupCount=5,
-        encoding="utf-8"
-    )
-    file_handler.setFormatter(
-        logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-    )
-    logger.addHandler(file_handler)
-
-    # Separate handlers for different log types
-    handlers = {
-        "tickets": logging.handlers.RotatingFileHandler(
-            filename=LOGS_DIR / "tickets.log",
-            maxBytes=5_242_880,
-            backupCount=5,
-            encoding="utf-8"
-        ),
-        "staff": logging.handlers.RotatingFileHandler(
-            filename=LOGS_DIR / "staff.log",
-            maxBytes=5_242_880,
-            backupCount=5,
-            encoding="utf-8"
-        ),
-        "database": logging.handlers.RotatingFileHandler(
-            filename=LOGS_DIR / "database.log",
-            maxBytes=5_242_880,
-            backupCount=5,
-            encoding="utf-8"
-        ),
-        "api": logging.handlers.RotatingFileHandler(
-            filename=LOGS_DIR / "api.log",
-            maxBytes=5_242_880,
-            backupCount=5,
-            encoding="utf-8"
-        )
-    }
+    logger.addHandler(_rotating_file_handler("nexon.log"))
 
-    # Configure each handler
-    for name, handler in handlers.items():
-        handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S"
-            )
-        )
-        logger.addHandler(handler)
+    # Attach each component's file to its own logger (see get_logger) so a
+    # record only lands in its component's file; propagation still sends it
+    # to the console and nexon.log
+    for name in ("tickets", "staff", "database", "api"):
+        get_logger(name).addHandler(_rotating_file_handler(f"{name}.log"))
 
     return logger
 
@@ -131,11 +115,14 @@ def get_logger(name: str) -> logging.Logger:
 # Logging decorators
 def log_ticket_activity(func):
     """Decorator to log ticket-related activities"""
+    # Looked up once per decorated function rather than on every call
+    logger = get_logger("tickets")
+
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = get_logger("tickets")
         try:
             result = await func(*args, **kwargs)
-            logger.info(f"Ticket activity: {func.__name__} | Args: {args} | Kwargs: {kwargs}")
+            logger.info("Ticket activity: %s | Args: %s | Kwargs: %s", func.__name__, args, kwargs)
             return result
         except Exception as e:
             logger.error(f"Ticket error in {func.__name__}: {str(e)}", exc_info=True)
@@ -144,11 +131,13 @@ def log_ticket_activity(func):
 
 def log_staff_activity(func):
     """Decorator to log staff-related activities"""
+    logger = get_logger("staff")
+
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = get_logger("staff")
         try:
             result = await func(*args, **kwargs)
-            logger.info(f"Staff activity: {func.__name__} | Args: {args} | Kwargs: {kwargs}")
+            logger.info("Staff activity: %s | Args: %s | Kwargs: %s", func.__name__, args, kwargs)
             return result
         except Exception as e:
             logger.error(f"Staff error in {func.__name__}: {str(e)}", exc_info=True)
@@ -157,11 +146,15 @@ def log_staff_activity(func):
 
 def log_database_activity(func):
     """Decorator to log database operations"""
+    logger = get_logger("database")
+
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = get_logger("database")
         try:
             result = await func(*args, **kwargs)
-            logger.debug(f"Database operation: {func.__name__} | Args: {args} | Kwargs: {kwargs}")
+            # Skip building the call repr entirely unless DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Database operation: %s | Args: %s | Kwargs: %s", func.__name__, args, kwargs)
             return result
         except Exception as e:
             logger.error(f"Database error in {func.__name__}: {str(e)}", exc_info=True)
@@ -170,11 +163,14 @@ def log_database_activity(func):
 
 def log_api_activity(func):
     """Decorator to log API calls"""
+    logger = get_logger("api")
+
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = get_logger("api")
         try:
             result = await func(*args, **kwargs)
-            logger.debug(f"API call: {func.__name__} | Args: {args} | Kwargs: {kwargs}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API call: %s | Args: %s | Kwargs: %s", func.__name__, args, kwargs)
             return result
         except Exception as e:
             logger.error(f"API error in {func.__name__}: {str(e)}", exc_info=True)
@@ -2,14 +2,45 @@
 Utility functions for handling Discord permissions and role checks.
 """
 
+import time
 import discord
-from typing import List
+from typing import AbstractSet, Dict, FrozenSet, Iterable, Optional, Tuple
 from database import db_manager
 from database.models import Guild, TicketCategory
 
-def has_staff_role(user: discord.Member, staff_role_ids: List[int]) -> bool:
+# Seconds a category's staff roles are reused before re-reading the database
+CATEGORY_STAFF_ROLES_TTL = 60.0
+
+# category_id -> (fetched_at, staff_role_ids); None marks a missing category
+_category_staff_roles_cache: Dict[int, Tuple[float, Optional[FrozenSet[int]]]] = {}
+
+def has_staff_role(user: discord.Member, staff_role_ids: Iterable[int]) -> bool:
     """Check if a user has any of the specified staff roles."""
-    return any(role.id in staff_role_ids for role in user.roles)
+    if not isinstance(staff_role_ids, AbstractSet):
+        staff_role_ids = frozenset(staff_role_ids)
+    return not staff_role_ids.isdisjoint(role.id for role in user.roles)
+
+async def get_category_staff_role_ids(category_id: int) -> Optional[FrozenSet[int]]:
+    """Get a category's staff role IDs, re-reading the database at most once per TTL."""
+    now = time.monotonic()
+    cached = _category_staff_roles_cache.get(category_id)
+    if cached is not None and now - cached[0] < CATEGORY_STAFF_ROLES_TTL:
+        return cached[1]
+
+    async with db_manager.get_session() as session:
+        category = await session.get(TicketCategory, category_id)
+        # Stored as a frozenset so every check against it is a set operation
+        staff_role_ids = frozenset(category.staff_role_ids or ()) if category else None
+
+    _category_staff_roles_cache[category_id] = (now, staff_role_ids)
+    return staff_role_ids
+
+def invalidate_category_staff_roles(category_id: Optional[int] = None) -> None:
+    """Drop cached staff roles for a category, or for all categories; call after editing them."""
+    if category_id is None:
+        _category_staff_roles_cache.clear()
+    else:
+        _category_staff_roles_cache.pop(category_id, None)
 
 async def has_category_staff_role(interaction: discord.Interaction, category_id: int) -> bool:
     """
@@ -22,13 +53,16 @@ async def has_category_staff_role(interaction: discord.Interaction, category_id:
     Returns:
         bool: True if the user has a staff role for the category, False otherwise
     """
-    async with db_manager.get_session() as session:
-        # Get category
-        category = await session.get(TicketCategory, category_id)
-        if not category:
-            return False
-            
-        # Check if user has any staff role for this category
-        return has_staff_role(interaction.user, category.staff_role_ids)
+    staff_role_ids = await get_category_staff_role_ids(category_id)
+    if staff_role_ids is None:
+        return False
+    
+    # Check if user has any staff role for this category
+    return has_staff_role(interaction.user, staff_role_ids)
 
-__all__ = ['has_staff_role', 'has_category_staff_role']
\ No newline at end of file
+__all__ = [
+    'has_staff_role',
+    'get_category_staff_role_ids',
+    'invalidate_category_staff_roles',
+    'has_category_staff_role'
+]
\ No newline at end of file
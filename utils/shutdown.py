@@ -3,6 +3,9 @@ import asyncio
 from datetime import datetime
 from utils.logger import logger
 
+# Seconds a single shutdown hook may run before it is abandoned
+SHUTDOWN_HOOK_TIMEOUT = 5.0
+
 class ShutdownManager:
     def __init__(self, bot):
         self.bot = bot
@@ -14,6 +17,15 @@ class ShutdownManager:
         self.shutdown_hooks.append(hook)
         logger.debug(f"Registered shutdown hook: {hook.__name__}")
 
+    async def _safe_run(self, hook: Callable[[], Coroutine]):
+        """Run one shutdown hook, logging instead of raising on failure or timeout"""
+        try:
+            await asyncio.wait_for(hook(), timeout=SHUTDOWN_HOOK_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error(f"Shutdown hook {hook.__name__} timed out after {SHUTDOWN_HOOK_TIMEOUT}s")
+        except Exception as e:
+            logger.error(f"Error in shutdown hook {hook.__name__}: {e}")
+
     async def execute_shutdown(self, reason: Optional[str] = None):
         """Execute graceful shutdown sequence"""
         if self.is_shutting_down:
@@ -23,12 +35,11 @@ class ShutdownManager:
         logger.info(f"🔄 Initiating graceful shutdown... Reason: {reason or 'Not specified'}")
 
         try:
-            # Execute all shutdown hooks
-            for hook in self.shutdown_hooks:
-                try:
-                    await hook()
-                except Exception as e:
-                    logger.error(f"Error in shutdown hook {hook.__name__}: {e}")
+            # Execute all shutdown hooks concurrently so they overlap
+            await asyncio.gather(
+                *(self._safe_run(hook) for hook in self.shutdown_hooks),
+                return_exceptions=True
+            )
 
             # Stop task manager
             if hasattr(self.bot, 'task_manager'):
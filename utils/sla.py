@@ -1,20 +1,95 @@
 """
 Service Level Agreement (SLA) tracking utilities for the ticket system.
 """
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+import asyncio
+import time
+from datetime import timezone
+from typing import Dict, Any, List, Optional, Set, Tuple
 import discord
-from database.models import Ticket, SLADefinition, Guild
+from database.models import Ticket, SLADefinition, Guild, category_sla_rules
 from sqlalchemy import select
 from utils.logger import logger
 
-async def check_sla_status(ticket: Ticket, sla_def: SLADefinition) -> Dict[str, Any]:
+def _elapsed_seconds(ticket: Ticket, now: Optional[float] = None) -> float:
+    """Seconds since the ticket was opened, measured against now (a POSIX timestamp)"""
+    if now is None:
+        now = time.time()
+    # opened_at is stored as naive UTC, so pin the zone before converting
+    return now - ticket.opened_at.replace(tzinfo=timezone.utc).timestamp()
+
+# SLA states returned by _sla_state, indexing _SLA_STATUS_INFO
+SLA_OK, SLA_WARNING, SLA_RESPONSE_BREACHED, SLA_RESOLUTION_BREACHED = range(4)
+
+# Status details per state; 'percentage' is filled in per ticket. Colors are
+# built once here instead of on every check.
+_SLA_STATUS_INFO = (
+    {
+        'status': 'ok',
+        'percentage': None,
+        'color': discord.Color.green(),
+        'emoji': '🟢',
+        'message': 'Within SLA'
+    },
+    {
+        'status': 'warning',
+        'percentage': None,
+        'color': discord.Color.orange(),
+        'emoji': '🟡',
+        'message': 'Approaching SLA breach'
+    },
+    {
+        'status': 'breached',
+        'percentage': None,
+        'color': discord.Color.red(),
+        'emoji': '🔴',
+        'message': 'Response time SLA breached'
+    },
+    {
+        'status': 'breached',
+        'percentage': None,
+        'color': discord.Color.red(),
+        'emoji': '🔴',
+        'message': 'Resolution time SLA breached'
+    }
+)
+
+def _sla_state(
+    elapsed_seconds: float,
+    responded: bool,
+    response_time: int,
+    resolution_time: int
+) -> Tuple[int, float]:
+    """Classify elapsed time against SLA limits in minutes; returns (state, percentage)"""
+    # Response time SLA check
+    if not responded and elapsed_seconds > response_time * 60:
+        return SLA_RESPONSE_BREACHED, 100
+
+    # Resolution time SLA check
+    percentage = min((elapsed_seconds / (resolution_time * 60)) * 100, 100)
+    if percentage >= 100:
+        return SLA_RESOLUTION_BREACHED, percentage
+    elif percentage >= 75:
+        return SLA_WARNING, percentage
+    return SLA_OK, percentage
+
+def _sla_status_info(state: int, percentage: float) -> Dict[str, Any]:
+    """Build the status dict for an SLA state"""
+    info = dict(_SLA_STATUS_INFO[state])
+    info['percentage'] = percentage
+    return info
+
+async def check_sla_status(
+    ticket: Ticket,
+    sla_def: SLADefinition,
+    now: Optional[float] = None
+) -> Dict[str, Any]:
     """
     Check ticket SLA status and return status information
     
     Args:
         ticket: The ticket to check
         sla_def: The SLA definition to check against
+        now: Optional POSIX timestamp to measure against, defaults to the current time
         
     Returns:
         Dict containing status information including:
@@ -24,47 +99,33 @@ async def check_sla_status(ticket: Ticket, sla_def: SLADefinition) -> Dict[str,
         - emoji: Status emoji
         - message: Status message
     """
-    now = datetime.utcnow()
-    elapsed = now - ticket.opened_at
-    elapsed_minutes = elapsed.total_seconds() / 60
+    return _sla_status_info(*_sla_state(
+        _elapsed_seconds(ticket, now),
+        bool(ticket.last_staff_response_at),
+        sla_def.response_time,
+        sla_def.resolution_time
+    ))
 
-    # Response time SLA check
-    if not ticket.last_staff_response_at and elapsed_minutes > sla_def.response_time:
-        return {
-            'status': 'breached',
-            'percentage': 100,
-            'color': discord.Color.red(),
-            'emoji': '🔴',
-            'message': 'Response time SLA breached'
-        }
-
-    # Resolution time SLA check
-    percentage = min((elapsed_minutes / sla_def.resolution_time) * 100, 100)
-    
-    if percentage >= 100:
-        return {
-            'status': 'breached',
-            'percentage': percentage,
-            'color': discord.Color.red(),
-            'emoji': '🔴',
-            'message': 'Resolution time SLA breached'
-        }
-    elif percentage >= 75:
-        return {
-            'status': 'warning',
-            'percentage': percentage,
-            'color': discord.Color.orange(),
-            'emoji': '🟡',
-            'message': 'Approaching SLA breach'
-        }
-    
-    return {
-        'status': 'ok',
-        'percentage': percentage,
+_SLA_ALERT_LEVELS = (
+    {
+        'level': 'normal',
         'color': discord.Color.green(),
         'emoji': '🟢',
         'message': 'Within SLA'
+    },
+    {
+        'level': 'warning',
+        'color': discord.Color.orange(),
+        'emoji': '🟡',
+        'message': 'SLA Warning'
+    },
+    {
+        'level': 'critical',
+        'color': discord.Color.red(),
+        'emoji': '🔴',
+        'message': 'SLA Breached'
     }
+)
 
 def get_sla_alert_level(percentage: float) -> Dict[str, Any]:
     """
@@ -77,25 +138,29 @@ def get_sla_alert_level(percentage: float) -> Dict[str, Any]:
         Dict containing alert level information
     """
     if percentage >= 100:
-        return {
-            'level': 'critical',
-            'color': discord.Color.red(),
-            'emoji': '🔴',
-            'message': 'SLA Breached'
-        }
+        return dict(_SLA_ALERT_LEVELS[2])
     elif percentage >= 75:
-        return {
-            'level': 'warning',
-            'color': discord.Color.orange(),
-            'emoji': '🟡',
-            'message': 'SLA Warning'
-        }
-    return {
-        'level': 'normal',
-        'color': discord.Color.green(),
-        'emoji': '🟢',
-        'message': 'Within SLA'
-    }
+        return dict(_SLA_ALERT_LEVELS[1])
+    return dict(_SLA_ALERT_LEVELS[0])
+
+async def _load_guilds(bot, guild_ids: Set[str]) -> Dict[str, Guild]:
+    """Load guilds by ID in their own session"""
+    async with bot.db.session() as session:
+        result = await session.execute(select(Guild).where(Guild.guild_id.in_(guild_ids)))
+        return {guild.guild_id: guild for guild in result.scalars()}
+
+async def _load_sla_definitions(bot, category_ids: Set[int]) -> Dict[int, SLADefinition]:
+    """Load the first SLA rule of each category in its own session"""
+    async with bot.db.session() as session:
+        result = await session.execute(
+            select(category_sla_rules.c.category_id, SLADefinition)
+            .join(category_sla_rules, category_sla_rules.c.sla_id == SLADefinition.id)
+            .where(category_sla_rules.c.category_id.in_(category_ids))
+        )
+        sla_defs = {}
+        for category_id, sla_def in result:
+            sla_defs.setdefault(category_id, sla_def)
+        return sla_defs
 
 async def sla_monitor(bot) -> None:
     """
@@ -112,47 +177,84 @@ async def sla_monitor(bot) -> None:
             )
             result = await session.execute(stmt)
             active_tickets = result.scalars().all()
+        if not active_tickets:
+            return
 
-            # Check each ticket's SLA
-            for ticket in active_tickets:
-                # Get guild SLA settings
-                guild_stmt = select(Guild).where(Guild.guild_id == ticket.guild_id)
-                guild_result = await session.execute(guild_stmt)
-                guild = guild_result.scalar_one_or_none()
+        # Load every guild and category SLA the tickets need; the two queries
+        # run on separate sessions so their round trips overlap
+        guilds, sla_defs = await asyncio.gather(
+            _load_guilds(bot, {ticket.guild_id for ticket in active_tickets}),
+            _load_sla_definitions(bot, {ticket.category_db_id for ticket in active_tickets})
+        )
 
-                if not guild:
-                    continue
+        # Check each ticket's SLA against one clock reading; status dicts are
+        # only built for tickets that need an alert
+        now = time.time()
+        alerts = []
+        for ticket in active_tickets:
+            guild = guilds.get(ticket.guild_id)
+            if not guild:
+                continue
 
-                # Get ticket category SLA
-                sla_stmt = select(SLADefinition).where(
-                    SLADefinition.category_id == ticket.category_db_id
-                )
-                sla_result = await session.execute(sla_stmt)
-                sla_def = sla_result.scalar_one_or_none()
+            sla_def = sla_defs.get(ticket.category_db_id)
+            if not sla_def:
+                continue
+
+            # Check SLA status
+            state, percentage = _sla_state(
+                _elapsed_seconds(ticket, now),
+                bool(ticket.last_staff_response_at),
+                sla_def.response_time,
+                sla_def.resolution_time
+            )
 
-                if not sla_def:
-                    continue
+            # Queue alerts if needed
+            if state != SLA_OK:
+                alerts.append((ticket, _sla_status_info(state, percentage), guild))
 
-                # Check SLA status
-                status = await check_sla_status(ticket, sla_def)
+        if not alerts:
+            return
 
-                # Send alerts if needed
-                if status['status'] in ['warning', 'breached']:
-                    await send_sla_alert(bot, ticket, status, guild)
+        # Resolve each guild's alert channel once, then send every alert concurrently
+        channel_ids = list({guild.ticket_logs_channel_id for _, _, guild in alerts})
+        channels = dict(zip(
+            channel_ids,
+            await asyncio.gather(*(get_alert_channel(bot, channel_id) for channel_id in channel_ids))
+        ))
+        await asyncio.gather(
+            *(
+                send_sla_alert(bot, ticket, status, guild, channels[guild.ticket_logs_channel_id])
+                for ticket, status, guild in alerts
+                if channels[guild.ticket_logs_channel_id]
+            ),
+            return_exceptions=True
+        )
 
     except Exception as e:
         logger.error(f"Error in SLA monitor: {e}")
 
+async def get_alert_channel(bot, channel_id: Optional[str]) -> Optional[discord.abc.Messageable]:
+    """Get an alert channel from the bot's cache, fetching it only on a miss"""
+    if not channel_id:
+        return None
+    try:
+        return bot.get_channel(int(channel_id)) or await bot.fetch_channel(int(channel_id))
+    except Exception as e:
+        logger.error(f"Error fetching SLA alert channel {channel_id}: {e}")
+        return None
+
 async def send_sla_alert(
     bot,
     ticket: Ticket,
     status: Dict[str, Any],
-    guild: Guild
+    guild: Guild,
+    alert_channel: Optional[discord.abc.Messageable] = None
 ) -> None:
     """Send SLA breach alerts to configured channels"""
     try:
-        # Get alert channel
-        alert_channel = await bot.fetch_channel(guild.ticket_logs_channel_id)
+        # Get alert channel unless the caller already resolved it
+        if alert_channel is None:
+            alert_channel = await get_alert_channel(bot, guild.ticket_logs_channel_id)
         if not alert_channel:
             return
 
@@ -171,7 +273,7 @@ async def send_sla_alert(
         
         embed.add_field(
             name="Time Open",
-            value=f"{(datetime.utcnow() - ticket.opened_at).total_seconds() / 3600:.1f} hours",
+            value=f"{_elapsed_seconds(ticket) / 3600:.1f} hours",
             inline=True
         )
 
@@ -185,5 +287,6 @@ __all__ = [
     'check_sla_status',
     'get_sla_alert_level',
     'sla_monitor',
+    'get_alert_channel',
     'send_sla_alert'
 ]
\ No newline at end of file